@@ -1,45 +1,335 @@
-import json
-import os
+import importlib.util
 import random
 
+# NumPy, imported when the first ArrayQTable is built; only the 'numpy' backend needs it, and
+# importing it takes longer than everything else the game loads before its window appears
+np = None
+
+try:
+    from .metrics import METRICS, timed
+    from .q_store import QTableStore
+except (ImportError, SystemError):
+    from metrics import METRICS, timed
+    from q_store import QTableStore
+
+BACKENDS = ('auto', 'dict', 'numpy')
+
+
+def _import_numpy():
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
+def encode_state(n, state):
+    # A state is the columns of the queens placed so far, one per row from the top; its key is
+    # the int bitmask with bit row * n + col set for every queen
+    key = 0
+    for row, col in enumerate(state):
+        key |= 1 << (row * n + col)
+    return key
+
+
+class Canonicalizer:
+    # Maps a state to one representative of its class under the 8 rotations and reflections of
+    # the board, so symmetric positions share one Q-table entry. The key covers the queens and the
+    # line the next queen goes on (row len(state) in the state's own orientation), since a rotated
+    # position fills columns or rows from the bottom; actions are positions along that line.
+    def __init__(self, n):
+        self.n = n
+        last = n - 1
+        self.square_bits = []  # per symmetry: bit of the image of square row * n + col
+        self.line_codes = []  # per symmetry: key bits of the image of each row as the next line
+        self.flips = []  # per symmetry: True if positions along the line are mirrored
+        for swap in (False, True):
+            for flip_rows in (False, True):
+                for flip_cols in (False, True):
+                    bits = []
+                    for row in range(n):
+                        for col in range(n):
+                            image_row = last - row if flip_rows else row
+                            image_col = last - col if flip_cols else col
+                            if swap:
+                                image_row, image_col = image_col, image_row
+                            bits.append(1 << (image_row * n + image_col))
+                    self.square_bits.append(bits)
+                    # Rows are lines 1..n, columns n+1..2n
+                    self.line_codes.append([((last - row if flip_rows else row) + (n if swap else 0) + 1) << (n * n)
+                                            for row in range(n)])
+                    self.flips.append(flip_cols)
+        # The line code sits above the square bits, so only images whose next line has the smallest
+        # code can be the minimum: the row itself or its mirror from the bottom, never a column
+        self.candidates = []
+        for row in range(n):
+            smallest = min(codes[row] for codes in self.line_codes)
+            self.candidates.append([t for t in range(8) if self.line_codes[t][row] == smallest])
+        # Images that can win before the board is full, then all 8 for a full board (no next line)
+        self.active = sorted({t for ts in self.candidates for t in ts})
+        self.candidates.append(list(range(8)))
+
+    def canonical(self, state):
+        # (key, flip): the smallest key among the 8 images, and whether an action (a column of the
+        # next row) must be mirrored to col -> n - 1 - col to address that image's table entry
+        n = self.n
+        row = len(state)
+        images = []
+        for t in self.candidates[row]:
+            bits = self.square_bits[t]
+            key = self.line_codes[t][row] if row < n else 0
+            for r, col in enumerate(state):
+                key |= bits[r * n + col]
+            images.append((key, self.flips[t]))
+        return min(images)
+
+
+class DictQTable:
+    # Q-values as {state key: {action: value}}. Entries changed since the last flush are in dirty.
+    # Both tables work on encoded state keys; QLearningAI does the encoding.
+    def __init__(self, n):
+        self.n = n
+        self.table = {}
+        self.dirty = set()  # (state key, action)
+
+    def __len__(self):
+        return len(self.table)
+
+    def best_action(self, key):
+        # Best tried action for the state, or None if the state has never been updated
+        actions = self.table.get(key)
+        if not actions:
+            return None
+        return max(actions, key=actions.get)
+
+    def action_values(self, key):
+        # {action: value} for the tried actions of a state
+        return dict(self.table.get(key, {}))
+
+    @timed('q.update')
+    def update_encoded(self, keys, actions, rewards, next_keys, alpha, gamma):
+        # One Q-learning step over many transitions, with the same batch rule as ArrayQTable: targets
+        # use the values before the batch and a repeated (state, action) pair moves by its mean TD
+        # error. Returns the change of each transition's pair, one per transition.
+        METRICS.count('q.updates', len(keys))
+        errors = {}
+        for key, action, reward, next_key in zip(keys, actions, rewards, next_keys):
+            next_actions = self.table.get(next_key) if next_key is not None else None
+            next_max = max(next_actions.values()) if next_actions else 0.0
+            error = reward + gamma * next_max - self.table.get(key, {}).get(action, 0.0)
+            total, count = errors.get((key, action), (0.0, 0))
+            errors[(key, action)] = (total + error, count + 1)
+        changes = {}
+        for (key, action), (total, count) in errors.items():
+            entry = self.table.setdefault(key, {})
+            changes[(key, action)] = change = alpha * total / count
+            entry[action] = entry.get(action, 0.0) + change
+            self.dirty.add((key, action))
+        return [changes[(key, action)] for key, action in zip(keys, actions)]
+
+    def value(self, key, action):
+        return self.table[key][action]
+
+    def items(self):
+        # (state key, action, value) for every entry; safe to call from a flush thread
+        for key, actions in list(self.table.items()):
+            for action, value in list(actions.items()):
+                yield key, action, value
+
+    def load(self, keys, actions, values):
+        for key, action, value in zip(keys, actions, values):
+            self.table.setdefault(key, {})[action] = value
+
+
+class ArrayQTable:
+    # Q-values in one NumPy array with a row of n action values per state, found through a dict
+    # from the encoded state to its row. Only tried actions count toward the max, as in DictQTable.
+    def __init__(self, n, capacity=1024):
+        try:
+            _import_numpy()
+        except ImportError as e:
+            raise ImportError("the 'numpy' Q-table backend needs NumPy: pip install numpy") from e
+        self.n = n
+        self.rows = {}  # state key -> row in values
+        self.keys = []  # row -> state key
+        self.values = np.zeros((capacity, n), dtype=np.float64)
+        self.tried = np.zeros((capacity, n), dtype=bool)
+        self.dirty = set()  # (state key, action) changed since the last flush
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _row_for_key(self, key):
+        row = self.rows.get(key)
+        if row is None:
+            row = self.rows[key] = len(self.rows)
+            self.keys.append(key)
+            if row == len(self.values):
+                # Grow geometrically so adding states stays amortized O(1)
+                self.values = np.concatenate([self.values, np.zeros_like(self.values)])
+                self.tried = np.concatenate([self.tried, np.zeros_like(self.tried)])
+        return row
+
+    def _lookup(self, keys):
+        # Rows for the given state keys, -1 where a state is unknown (or None, i.e. terminal)
+        return np.array([-1 if key is None else self.rows.get(key, -1) for key in keys], dtype=np.int64)
+
+    def best_action(self, key):
+        action = self.best_actions([key])[0]
+        return None if action < 0 else int(action)
+
+    def action_values(self, key):
+        # {action: value} for the tried actions of a state
+        row = self.rows.get(key)
+        if row is None:
+            return {}
+        actions = np.nonzero(self.tried[row])[0].tolist()
+        return dict(zip(actions, self.values[row, actions].tolist()))
+
+    def best_actions(self, keys):
+        # Greedy action for each state at once; -1 where a state has no tried action
+        rows = self._lookup(keys)
+        known = rows >= 0
+        masked = np.where(self.tried[rows], self.values[rows], -np.inf)
+        actions = masked.argmax(axis=1)
+        actions[~known | ~self.tried[rows].any(axis=1)] = -1
+        return actions
+
+    @timed('q.update')
+    def update_encoded(self, keys, actions, rewards, next_keys, alpha, gamma):
+        # One vectorized Q-learning step over many transitions given as encoded states (next key
+        # None for a terminal step). Every target is computed from the values before the batch, and
+        # a (state, action) pair seen several times moves by its mean TD error, so a large batch
+        # behaves like one averaged step rather than overshooting. Returns the change of each
+        # transition's pair, one per transition, as DictQTable does.
+        METRICS.count('q.updates', len(keys))
+        next_rows = self._lookup(next_keys)
+        next_max = np.where(self.tried[next_rows], self.values[next_rows], -np.inf).max(axis=1)
+        next_max[(next_rows < 0) | np.isneginf(next_max)] = 0.0
+        rows = np.array([self._row_for_key(key) for key in keys], dtype=np.int64)
+        actions = np.asarray(actions, dtype=np.int64)
+        errors = np.asarray(rewards, dtype=np.float64) + gamma * next_max - self.values[rows, actions]
+        pairs, inverse, counts = np.unique(rows * self.n + actions, return_inverse=True, return_counts=True)
+        changes = alpha * np.bincount(inverse.ravel(), weights=errors, minlength=len(pairs)) / counts
+        self.values.reshape(-1)[pairs] += changes
+        self.tried.reshape(-1)[pairs] = True
+        pair_rows, pair_actions = np.divmod(pairs, self.n)
+        self.dirty.update(zip([self.keys[row] for row in pair_rows.tolist()], pair_actions.tolist()))
+        return changes[inverse.ravel()]
+
+    def policy(self):
+        # {state key: greedy action} for every state with a tried action
+        count = len(self.rows)
+        tried = self.tried[:count]
+        actions = np.where(tried, self.values[:count], -np.inf).argmax(axis=1)
+        has_action = tried.any(axis=1)
+        return {key: int(actions[row]) for key, row in self.rows.items() if has_action[row]}
+
+    def value(self, key, action):
+        return float(self.values[self.rows[key], action])
+
+    def items(self):
+        # (state key, action, value) for every tried entry; safe to call from a flush thread
+        count = len(self.keys)
+        rows, actions = np.nonzero(self.tried[:count])
+        values = self.values[rows, actions].tolist()
+        keys = self.keys
+        return zip([keys[row] for row in rows.tolist()], actions.tolist(), values)
+
+    def load(self, keys, actions, values):
+        if not keys:
+            return
+        rows = np.array([self._row_for_key(key) for key in keys], dtype=np.int64)
+        actions = np.asarray(actions, dtype=np.int64)
+        self.values[rows, actions] = values
+        self.tried[rows, actions] = True
+
+
 class QLearningAI:
-    def __init__(self, n, storage_file='ai_memory.json'):
+    # backend='dict' keeps the table in dicts, backend='numpy' in an ArrayQTable; 'auto' picks numpy
+    # when it is installed. With symmetry=True the 8 rotations/reflections of a position share one
+    # entry. Each board size (and symmetry setting) has its own QTableStore, read on first use.
+    def __init__(self, n, storage_dir='ai_memory', backend='auto', symmetry=True):
+        if backend not in BACKENDS:
+            raise ValueError(f'unknown backend {backend!r}, expected one of {BACKENDS}')
+        if backend == 'auto':
+            backend = 'numpy' if importlib.util.find_spec('numpy') is not None else 'dict'
         self.n = n
-        self.storage_file = storage_file
-        self.q_table = self._load_q_table()
+        self.backend = backend
+        self.canonicalizer = Canonicalizer(n) if symmetry else None
+        self.store = QTableStore(n, storage_dir, variant='-d4' if symmetry else '')
+        self._q_table = None
         self.alpha = 0.5  # learning rate
         self.gamma = 0.9  # discount factor
         self.epsilon = 0.1  # exploration rate
 
-    def _load_q_table(self):
-        if os.path.exists(self.storage_file):
-            with open(self.storage_file, 'r') as f:
-                return json.load(f)
-        return {}
+    @property
+    def q_table(self):
+        # Loaded lazily, so creating an agent (e.g. on every board size change) does no I/O
+        if self._q_table is None:
+            table = ArrayQTable(self.n) if self.backend == 'numpy' else DictQTable(self.n)
+            table.load(*self.store.read())
+            self._q_table = table
+        return self._q_table
+
+    def save_q_table(self, background=False):
+        # Appends the entries changed since the last save; background=True returns immediately
+        if self._q_table is not None:
+            self.store.flush(self._q_table, background)
 
-    def save_q_table(self):
-        with open(self.storage_file, 'w') as f:
-            json.dump(self.q_table, f)
+    def checkpoint(self, background=False):
+        # Rewrites the log as one record per entry, dropping superseded records
+        if self._q_table is not None:
+            self.store.checkpoint(self._q_table, background)
+
+    def encode(self, state):
+        # (table key, flip) for a state; flip means actions are stored mirrored (col -> n - 1 - col)
+        if self.canonicalizer is not None:
+            return self.canonicalizer.canonical(state)
+        return encode_state(self.n, state), False
+
+    def best_action(self, state):
+        # Greedy column for the next row, or None if the state has never been updated
+        key, flip = self.encode(state)
+        action = self.q_table.best_action(key)
+        if action is not None and flip:
+            action = self.n - 1 - action
+        return action
+
+    def action_values(self, state):
+        # {column of the next row: learned value} for the columns tried from this state
+        key, flip = self.encode(state)
+        values = self.q_table.action_values(key)
+        if flip:
+            values = {self.n - 1 - action: value for action, value in values.items()}
+        return values
+
+    def column_ordering(self):
+        # Value ordering for NQueensSolver.search_first: best learned columns first, then the
+        # untried ones left to right
+        def order(prefix, candidates):
+            values = self.action_values(prefix)
+            return sorted(candidates, key=lambda col: (col not in values, -values.get(col, 0.0)))
+        return order
 
     def get_action(self, state):
-        # Epsilon-greedy: explore or exploit
-        if state not in self.q_table or random.random() < self.epsilon:
-            # Explore: random action
+        # Epsilon-greedy: None means explore (the caller picks a random action)
+        if random.random() < self.epsilon:
             return None
-        # Exploit: best known action
-        actions = self.q_table[state]
-        best_col = max(actions, key=actions.get)
-        return int(best_col)
+        return self.best_action(state)
 
     def update(self, state, action, reward, next_state):
-        state = str(state)
-        action = str(action)
-        if state not in self.q_table:
-            self.q_table[state] = {}
-        if action not in self.q_table[state]:
-            self.q_table[state][action] = 0
-        # Q-learning update
-        next_max = 0
-        if next_state in self.q_table and self.q_table[next_state]:
-            next_max = max(self.q_table[next_state].values())
-        self.q_table[state][action] += self.alpha * (reward + self.gamma * next_max - self.q_table[state][action]) 
\ No newline at end of file
+        self.update_batch([state], [action], [reward], [next_state])
+
+    def update_batch(self, states, actions, rewards, next_states):
+        # Applies many transitions as one batched step, the same on both backends (see update_encoded())
+        # and vectorized on numpy. Returns the change of each transition's state-action pair: a list,
+        # or an array on the numpy backend.
+        keys = []
+        table_actions = []
+        for state, action in zip(states, actions):
+            key, flip = self.encode(state)
+            keys.append(key)
+            table_actions.append(self.n - 1 - action if flip else action)
+        next_keys = [None if state is None else self.encode(state)[0] for state in next_states]
+        return self.q_table.update_encoded(keys, table_actions, rewards, next_keys, self.alpha, self.gamma)
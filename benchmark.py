@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+try:
+    from .ai_learning import QLearningAI
+    from .nqueens_ai import ORDERINGS, NQueensSolver, SearchTimeout
+    from .nqueens_parallel import count_parallel, enumerate_parallel
+    from .solver_service import SolverService
+except (ImportError, SystemError):
+    from ai_learning import QLearningAI
+    from nqueens_ai import ORDERINGS, NQueensSolver, SearchTimeout
+    from nqueens_parallel import count_parallel, enumerate_parallel
+    from solver_service import SolverService
+
+# Number of solutions for n = 0..18 (OEIS A000170), to check every counting and enumerating case
+KNOWN_COUNTS = [1, 1, 0, 0, 2, 10, 4, 40, 92, 352, 724, 2680, 14200, 73712, 365596, 2279184,
+                14772512, 95815104, 666090624]
+# Suite cases, in the order they run for each board size
+CASES = ('count', 'count_parallel', 'enumerate', 'enumerate_parallel', 'first_natural', 'first_least_constrained')
+
+
+def time_first_solution(n, ordering, timeout):
+    # (seconds, nodes) for search_first, or (None, nodes) if it ran past the timeout
+    solver = NQueensSolver(n)
+    started = time.perf_counter()
+    try:
+        solution = solver.search_first(ordering, deadline=started + timeout)
+    except SearchTimeout:
+        return None, solver.nodes_visited
+    elapsed = time.perf_counter() - started
+    if solution is None and n not in (2, 3):
+        raise AssertionError(f'search_first found no solution for n={n}')
+    return elapsed, solver.nodes_visited
+
+
+def bench_ordering(sizes, timeout=10.0, storage_dir='ai_memory'):
+    # Time to first solution per value ordering. The Q-table ordering is only measured for sizes
+    # with a trained table (see train_ai.py).
+    results = []
+    for n in sizes:
+        orderings = [(name, name) for name in ORDERINGS]
+        ai = QLearningAI(n, storage_dir=storage_dir)
+        if len(ai.q_table):
+            orderings.append(('q_table', ai.column_ordering()))
+        for name, ordering in orderings:
+            seconds, nodes = time_first_solution(n, ordering, timeout)
+            results.append({'n': n, 'ordering': name, 'seconds': seconds, 'nodes': nodes})
+            shown = 'timeout' if seconds is None else f'{seconds * 1000:10.2f} ms'
+            print(f'n={n:3d}  {name:18s} {shown:>13s}  {nodes:>10,} nodes')
+    return results
+
+
+def is_solution(n, columns):
+    return (columns is not None and len(columns) == n and len(set(columns)) == n
+            and len({row - col for row, col in enumerate(columns)}) == n
+            and len({row + col for row, col in enumerate(columns)}) == n)
+
+
+def run_case(case, n, service):
+    # The case's result: a solution count, or for first_* cases whether a valid solution came back
+    solver = NQueensSolver(n)
+    if case == 'count':
+        return solver.count()
+    if case == 'count_parallel':
+        return count_parallel(service, n)[0]
+    if case == 'enumerate':
+        return len(solver.solve())
+    if case == 'enumerate_parallel':
+        return len(enumerate_parallel(service, n))
+    solution = solver.search_first(case[len('first_'):])
+    return solution is None if KNOWN_COUNTS[n] == 0 else is_solution(n, solution)
+
+
+def bench_suite(sizes, repeat=3, max_enumerate=13, workers=None):
+    # Every case for every size: best of up to `repeat` timings (slow cases stop repeating after
+    # a couple of seconds), with each result checked against KNOWN_COUNTS. The pool is started
+    # and warmed up before anything is timed.
+    service = SolverService(workers)
+    results = []
+    try:
+        count_parallel(service, 8)
+        for n in sizes:
+            for case in CASES:
+                if case.startswith('enumerate') and n > max_enumerate:
+                    continue
+                best = None
+                spent = 0.0
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    result = run_case(case, n, service)
+                    elapsed = time.perf_counter() - started
+                    best = elapsed if best is None else min(best, elapsed)
+                    spent += elapsed
+                    if spent > 2.0:
+                        break
+                expected = True if case.startswith('first_') else KNOWN_COUNTS[n]
+                ok = result == expected
+                results.append({'case': case, 'n': n, 'seconds': best, 'result': result, 'ok': ok})
+                print(f'n={n:2d}  {case:24s} {best * 1000:12.2f} ms  {"ok" if ok else f"WRONG: {result} != {expected}"}')
+    finally:
+        service.shutdown()
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'workers': service.max_workers,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold=1.10, min_seconds=0.005):
+    # Matches cases by (case, n). A case regresses when it is more than `threshold` times slower
+    # than the baseline (cases under min_seconds in both runs are too noisy to judge). Returns the
+    # number of regressions plus wrong results.
+    before = {(r['case'], r['n']): r for r in baseline['results']}
+    problems = 0
+    for row in current['results']:
+        key = (row['case'], row['n'])
+        if not row['ok']:
+            print(f'n={row["n"]:2d}  {row["case"]:24s} WRONG RESULT {row["result"]}')
+            problems += 1
+            continue
+        old = before.get(key)
+        if old is None:
+            print(f'n={row["n"]:2d}  {row["case"]:24s} {row["seconds"] * 1000:12.2f} ms  (new)')
+            continue
+        ratio = row['seconds'] / old['seconds'] if old['seconds'] else float('inf')
+        noisy = max(row['seconds'], old['seconds']) < min_seconds
+        flag = ''
+        if ratio > threshold and not noisy:
+            flag = '  REGRESSION'
+            problems += 1
+        elif ratio < 1 / threshold and not noisy:
+            flag = '  faster'
+        print(f'n={row["n"]:2d}  {row["case"]:24s} {old["seconds"] * 1000:12.2f} -> '
+              f'{row["seconds"] * 1000:12.2f} ms  x{ratio:.2f}{flag}')
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the N-Queens solvers.')
+    suites = parser.add_subparsers(dest='suite', required=True)
+    ordering = suites.add_parser('ordering', help='time to first solution with and without value ordering')
+    ordering.add_argument('sizes', nargs='*', type=int, default=[8, 10, 12, 16, 20, 24, 28, 32])
+    ordering.add_argument('--timeout', type=float, default=10.0, help='seconds allowed per search')
+    ordering.add_argument('--storage-dir', default='ai_memory', help='where trained Q-tables are read from')
+    suite = suites.add_parser('suite', help='single vs multi-core, count vs enumerate, time to first solution')
+    suite.add_argument('sizes', nargs='*', type=int, default=list(range(4, 17)))
+    suite.add_argument('--repeat', type=int, default=3, help='runs per case; the best time is kept')
+    suite.add_argument('--max-enumerate', type=int, default=13,
+                       help='largest n for enumerate cases (every solution is held in memory)')
+    suite.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    suite.add_argument('--json', help='write the results to this file')
+    diff = suites.add_parser('compare', help='compare two --json results and flag regressions')
+    diff.add_argument('baseline')
+    diff.add_argument('current')
+    diff.add_argument('--threshold', type=float, default=1.10, help='slowdown ratio that counts as a regression')
+    args = parser.parse_args(argv)
+    if args.suite == 'ordering':
+        bench_ordering(args.sizes, args.timeout, args.storage_dir)
+    elif args.suite == 'suite':
+        # Every result is checked against KNOWN_COUNTS, so sizes past its end cannot be benchmarked
+        largest = len(KNOWN_COUNTS) - 1
+        bad = [n for n in args.sizes if not 1 <= n <= largest]
+        if bad:
+            parser.error(f'suite sizes must be between 1 and {largest}, got {", ".join(map(str, bad))}')
+        report = bench_suite(args.sizes, args.repeat, args.max_enumerate, args.workers)
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(report, f, indent=2)
+        if not all(row['ok'] for row in report['results']):
+            sys.exit(1)
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        problems = compare(baseline, current, args.threshold)
+        print(f'{problems} regression(s) or wrong result(s)')
+        sys.exit(1 if problems else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+class BoardModel:
+    # Queens on an n x n board plus occupancy counters per row, column and diagonal, kept up to
+    # date on every place/remove. Validity, attack counts and "is solved" are O(1) per move.
+    # Nothing here depends on Qt, so the model works headless as well as behind BoardWidget.
+    def __init__(self, n, queens=()):
+        self.n = n
+        self.clear()
+        for row, col in queens:
+            self.place(row, col)
+
+    def clear(self):
+        n = self.n
+        self._queens = {}  # (row, col) -> None, in placement order
+        self.rows = [0] * n
+        self.cols = [0] * n
+        self.diags = [0] * (2 * n - 1)  # indexed by row - col + n - 1
+        self.antis = [0] * (2 * n - 1)  # indexed by row + col
+        self.attacking_pairs = 0
+
+    @property
+    def queens(self):
+        return list(self._queens)
+
+    def __len__(self):
+        return len(self._queens)
+
+    def __contains__(self, square):
+        return square in self._queens
+
+    def __iter__(self):
+        return iter(list(self._queens))
+
+    def attacks(self, row, col):
+        # Number of queens attacking (row, col), not counting a queen standing on it
+        count = self.rows[row] + self.cols[col] + self.diags[row - col + self.n - 1] + self.antis[row + col]
+        if (row, col) in self._queens:
+            count -= 4
+        return count
+
+    def is_valid(self, row, col):
+        # (valid, reason) for a queen on (row, col) against every other queen
+        own = 1 if (row, col) in self._queens else 0
+        if self.cols[col] > own:
+            return False, 'Column is already occupied by another queen.'
+        if self.rows[row] > own:
+            return False, 'Row is already occupied by another queen.'
+        if self.diags[row - col + self.n - 1] > own or self.antis[row + col] > own:
+            return False, 'This diagonal is attacked by another queen.'
+        return True, ''
+
+    def place(self, row, col):
+        if not (0 <= row < self.n and 0 <= col < self.n):
+            raise ValueError(f'({row}, {col}) is off the {self.n}x{self.n} board')
+        if (row, col) in self._queens:
+            raise ValueError(f'({row}, {col}) already holds a queen')
+        self.attacking_pairs += self.attacks(row, col)
+        self._update(row, col, 1)
+        self._queens[(row, col)] = None
+
+    def remove(self, row, col):
+        del self._queens[(row, col)]
+        self._update(row, col, -1)
+        self.attacking_pairs -= self.attacks(row, col)
+
+    def is_solved(self):
+        return len(self._queens) == self.n and self.attacking_pairs == 0
+
+    def _update(self, row, col, delta):
+        self.rows[row] += delta
+        self.cols[col] += delta
+        self.diags[row - col + self.n - 1] += delta
+        self.antis[row + col] += delta
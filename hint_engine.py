@@ -0,0 +1,225 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+try:
+    from .board_model import BoardModel
+    from .nqueens_ai import NQueensSolver, SearchTimeout
+except (ImportError, SystemError):
+    from board_model import BoardModel
+    from nqueens_ai import NQueensSolver, SearchTimeout
+
+# Largest board whose full solution set is indexed for instant completion counts (14,200 solutions at 12)
+MAX_INDEX_N = 12
+
+# kind is 'solved', 'place', 'move', 'remove' or 'none'. squares: the square to place on;
+# the queen to move and its target; or the queens to remove. guaranteed is False when the
+# latency budget ran out and the suggestion is only known to be safe, not to lead to a solution.
+Hint = namedtuple('Hint', 'kind squares guaranteed')
+
+
+class CompletionIndex:
+    # Every solution of one board size, numbered, with a bitset per square of the solutions
+    # that have a queen there. The completions of a partial board are the AND of its squares'
+    # bitsets, so the answer takes a handful of big-int operations instead of a search.
+    def __init__(self, n, solutions):
+        self.n = n
+        self.total = len(solutions)
+        width = (self.total + 7) // 8
+        squares = [[bytearray(width) for _ in range(n)] for _ in range(n)]
+        for number, solution in enumerate(solutions):
+            byte, bit = divmod(number, 8)
+            for row, col in enumerate(solution):
+                squares[row][col][byte] |= 1 << bit
+        self._squares = [[int.from_bytes(bits, 'little') for bits in row] for row in squares]
+        self._all = (1 << self.total) - 1
+        self._memo = {}
+
+    @classmethod
+    def build(cls, n, solution_cache=None):
+        # Reuses the on-disk solution set when there is one; otherwise solves the board
+        solutions = solution_cache.load(n) if solution_cache is not None else None
+        if solutions is None:
+            solutions = NQueensSolver(n).solve_symmetric()
+        return cls(n, solutions)
+
+    def completions(self, queens):
+        # Number of full solutions that keep every given queen
+        key = self._canonical(queens)
+        if key not in self._memo:
+            if len({row for row, _ in key}) != len(key):
+                count = 0
+            else:
+                matches = self._all
+                for row, col in key:
+                    matches &= self._squares[row][col]
+                    if not matches:
+                        break
+                count = bin(matches).count('1')
+            if len(self._memo) > 100000:
+                self._memo.clear()
+            self._memo[key] = count
+        return self._memo[key]
+
+    def completable(self, queens):
+        return self.completions(queens) > 0
+
+    def _canonical(self, queens):
+        # Rotations and reflections of a position have the same completions; share one memo entry
+        last = self.n - 1
+        variants = []
+        squares = list(queens)
+        for _ in range(4):
+            squares = [(col, last - row) for row, col in squares]
+            variants.append(tuple(sorted(squares)))
+            variants.append(tuple(sorted((row, last - col) for row, col in squares)))
+        return min(variants)
+
+
+class HintEngine:
+    # Suggests moves that keep the board solvable. Small boards use the CompletionIndex; larger
+    # ones run a bitmask completion search from the current queens and, when that runs out of
+    # time (it nearly always does on big boards), a min-conflicts repair that keeps the queens in
+    # place. Answers are cached per position (LRU), so revisited boards answer instantly.
+    # The index is built on a background thread (a few tenths of a second at 12x12); until it is
+    # ready the engine answers like a large board, and on_index_ready(n) is called once it is.
+    def __init__(self, n, latency_budget=0.05, cache_size=512, solution_cache=None, repair_budget=0.2,
+                 on_index_ready=None):
+        self.n = n
+        self.solver = NQueensSolver(n)
+        self.latency_budget = latency_budget
+        self.repair_budget = repair_budget  # Extra seconds per hint for the repair fallback
+        self.cache_size = cache_size
+        self.solution_cache = solution_cache
+        self.on_index_ready = on_index_ready
+        self._cache = OrderedDict()
+        self._index = None
+        self._index_thread = None
+
+    @property
+    def index(self):
+        # None for boards above MAX_INDEX_N, and while the index is still being built
+        if self._index is None:
+            self.prepare()
+        return self._index
+
+    def prepare(self):
+        # Starts building the index in the background, if this board size has one
+        if self.n > MAX_INDEX_N or self._index_thread is not None:
+            return
+        self._index_thread = threading.Thread(target=self._build_index, name='completion-index', daemon=True)
+        self._index_thread.start()
+
+    def wait_for_index(self, timeout=None):
+        # The index once it is built (None for large boards or if timeout runs out first)
+        self.prepare()
+        if self._index_thread is not None:
+            self._index_thread.join(timeout)
+        return self._index
+
+    def _build_index(self):
+        self._index = CompletionIndex.build(self.n, self.solution_cache)
+        if self.on_index_ready is not None:
+            self.on_index_ready(self.n)
+
+    def completions(self, queens):
+        # Number of ways the position can still be finished, or None if the board is too big to index
+        # or the index is not ready yet
+        index = self.index
+        return index.completions(queens) if index is not None else None
+
+    def suggest(self, queens):
+        key = frozenset(queens)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        deadline = time.perf_counter() + self.latency_budget
+        try:
+            hint = self._suggest(list(queens), deadline)
+        except SearchTimeout:
+            # Neither search nor repair found an answer: fall back to a square nothing attacks,
+            # without caching the guess
+            return self._safe_square(queens)
+        self._cache[key] = hint
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return hint
+
+    def _suggest(self, queens, deadline):
+        model = BoardModel(self.n, queens)
+        if model.is_solved():
+            return Hint('solved', [], True)
+        if not queens and self.index is None:
+            # Nothing to keep: the constructive solution gives a valid first move at any size
+            solution = self.solver.find_one()
+            if solution is None:
+                return Hint('none', [], True)
+            return Hint('place', [(0, solution[0])], True)
+        row = self._first_open_row(queens)
+        if row is not None:
+            square = self._best_square(queens, row, deadline)
+            if square is not None:
+                return Hint('place', [square], True)
+        # Dead end: find one queen that could move somewhere the rest can still be completed
+        by_attacks = sorted(queens, key=lambda square: -model.attacks(*square))
+        for queen in by_attacks:
+            rest = [square for square in queens if square != queen]
+            if all(row != queen[0] for row, _ in rest):
+                square = self._best_square(rest, queen[0], deadline)
+                if square is not None:
+                    return Hint('move', [queen, square], True)
+            elif self._completable(rest, deadline):
+                return Hint('remove', [queen], True)
+        # Several queens are in the way: drop the most attacked ones until the rest can be completed
+        removed = []
+        rest = list(queens)
+        for queen in by_attacks:
+            removed.append(queen)
+            rest.remove(queen)
+            if self._completable(rest, deadline):
+                return Hint('remove', removed, True)
+        return Hint('none', [], True)
+
+    def _first_open_row(self, queens):
+        taken = {row for row, _ in queens}
+        for row in range(self.n):
+            if row not in taken:
+                return row
+        return None
+
+    def _best_square(self, queens, row, deadline):
+        # A square on `row` from which the position can still be finished (the one with the most
+        # completions when the board is indexed), or None
+        index = self.index
+        if index is not None:
+            count, col = max((index.completions(queens + [(row, col)]), col) for col in range(self.n))
+            return (row, col) if count else None
+        solution = self._complete(queens, deadline)
+        return (row, solution[row]) if solution is not None else None
+
+    def _completable(self, queens, deadline):
+        index = self.index
+        if index is not None:
+            return index.completable(queens)
+        return self._complete(queens, deadline) is not None
+
+    def _complete(self, queens, deadline):
+        # complete(), falling back to repair() until repair_budget past the deadline. A failed repair
+        # proves nothing, so it raises SearchTimeout like the search it stands in for.
+        try:
+            return self.solver.complete(queens, deadline)
+        except SearchTimeout:
+            solution = self.solver.repair(queens, deadline=deadline + self.repair_budget)
+            if solution is None:
+                raise
+            return solution
+
+    def _safe_square(self, queens):
+        model = BoardModel(self.n, queens)
+        for row in range(self.n):
+            if model.rows[row]:
+                continue
+            for col in range(self.n):
+                if model.attacks(row, col) == 0:
+                    return Hint('place', [(row, col)], False)
+        return Hint('none', [], False)
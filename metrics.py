@@ -0,0 +1,147 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+class Histogram:
+    # Count, total, min and max of every recorded value, plus the most recent ones for percentiles
+    def __init__(self, keep=1024):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.recent = deque(maxlen=keep)
+
+    def record(self, value):
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def percentile(self, fraction):
+        # Of the recent values; None before the first one
+        if not self.recent:
+            return None
+        values = sorted(self.recent)
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+        }
+
+
+class _Timer:
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    # Named counters and histograms (timers record seconds into a histogram). Everything is a no-op
+    # while disabled: timer() hands out one shared do-nothing context manager and count()/observe()
+    # return after a single attribute check, so instrumented hot paths cost next to nothing.
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()  # Solve jobs record from their own threads
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.perf_counter()
+            self.counters = {}
+            self.histograms = {}
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.record(value)
+
+    def timer(self, name):
+        # with metrics.timer('name'): ... records the block's duration
+        return _Timer(self, name) if self.enabled else NULL_TIMER
+
+    def snapshot(self):
+        with self._lock:
+            elapsed = time.perf_counter() - self.started
+            return {
+                'seconds': elapsed,
+                'counters': {name: {'count': count, 'per_second': count / elapsed if elapsed else 0.0}
+                             for name, count in self.counters.items()},
+                'histograms': {name: histogram.summary() for name, histogram in self.histograms.items()},
+            }
+
+    def format(self):
+        # One line for the status bar: p50/p95 of every timer in ms, then counter rates
+        snapshot = self.snapshot()
+        parts = [f'{name} {stats["p50"] * 1000:.2f}/{stats["p95"] * 1000:.2f} ms'
+                 for name, stats in sorted(snapshot['histograms'].items())]
+        parts += [f'{name} {stats["per_second"]:,.0f}/s' for name, stats in sorted(snapshot['counters'].items())]
+        return '  '.join(parts) if parts else 'No metrics yet'
+
+    def export(self, path):
+        # Writes a snapshot as JSON (histogram values in seconds)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        return path
+
+
+# Shared by the whole process; set NQUEENS_METRICS=1 to record from startup
+METRICS = Metrics(enabled=bool(os.environ.get('NQUEENS_METRICS')))
+
+
+def timed(name):
+    # Decorator: records every call's duration under name while METRICS is enabled
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                METRICS.observe(name, time.perf_counter() - started)
+        return wrapper
+    return decorate
@@ -1,13 +1,276 @@
+import random
+import time
+from itertools import islice
+
+ENGINES = ('bitmask', 'backtrack')
+FIND_ONE_METHODS = ('construct', 'min_conflicts', 'search')
+# Built-in column orders for search_first(); a callable works too
+ORDERINGS = ('natural', 'least_constrained')
+# Fresh random starts min-conflicts gets when a run stalls (find_one() and repair());
+# pinned queens make it stall more often
+REPAIR_RESTARTS = 10
+
+
+class SearchTimeout(Exception):
+    # Raised when a search runs past its deadline before reaching an answer
+    pass
+
+
+class SearchCancelled(Exception):
+    # Raised when the solver's cancel_check() reports that nobody wants the answer any more
+    pass
+
+
 class NQueensSolver:
-    def __init__(self, n):
+    def __init__(self, n, engine='bitmask'):
+        if engine not in ENGINES:
+            raise ValueError(f'Unknown engine {engine!r}, expected one of {ENGINES}')
         self.n = n
+        self.engine = engine
         self.solutions = []
+        # Optional callable polled every few thousand nodes by the bitmask searches;
+        # once it returns True they raise SearchCancelled
+        self.cancel_check = None
 
     def solve(self):
         self.solutions = []
-        self._backtrack([])
+        if self.engine == 'bitmask':
+            self.solutions = list(self._iter_bitmask())
+        else:
+            self._backtrack([])
         return self.solutions
 
+    def solve_from(self, prefix):
+        # All solutions whose first rows are fixed to the given columns
+        if self.engine == 'bitmask':
+            return list(self._iter_bitmask(prefix))
+        solutions = []
+        state = []
+        for row, col in enumerate(prefix):
+            if not self._is_valid(state, row, col):
+                return solutions
+            state.append(col)
+        saved = self.solutions
+        self.solutions = solutions
+        self._backtrack(state)
+        self.solutions = saved
+        return solutions
+
+    def iter_solutions(self, cursor=None):
+        # Yields solutions one at a time in the order solve() lists them.
+        # Passing a previously yielded solution as cursor resumes right after it.
+        if self.engine == 'bitmask':
+            yield from self._iter_bitmask(after=cursor)
+            return
+        for solution in self.solve():
+            if cursor is None or solution > list(cursor):
+                yield solution
+
+    def find_one(self, method='construct', seed=None, max_steps=None, ordering='natural'):
+        # A single solution, or None if the board has none. 'construct' is the closed-form O(n)
+        # pattern; 'min_conflicts' is a randomized repair search, restarted when a run stalls and
+        # backed by the construction if every run does; 'search' is search_first(ordering).
+        if method not in FIND_ONE_METHODS:
+            raise ValueError(f'Unknown method {method!r}, expected one of {FIND_ONE_METHODS}')
+        if self.n in (2, 3):
+            return None
+        if method == 'construct':
+            return self._construct()
+        if method == 'search':
+            return self.search_first(ordering)
+        rng = random.Random(seed)
+        for _ in range(REPAIR_RESTARTS):
+            solution = self._min_conflicts(rng.random(), max_steps)
+            if solution is not None:
+                return solution
+        return self._construct()
+
+    def search_first(self, ordering='natural', deadline=None):
+        # First solution of a depth-first search that tries each row's free columns in the order
+        # ordering gives: 'natural' (left to right, so the first solution solve() lists),
+        # 'least_constrained', or a callable (prefix, free_columns) -> the columns to try, in order.
+        # None if there is no solution. Sets nodes_visited; deadline works as in complete().
+        if not callable(ordering) and ordering not in ORDERINGS:
+            raise ValueError(f'Unknown ordering {ordering!r}, expected one of {ORDERINGS} or a callable')
+        n = self.n
+        full = (1 << n) - 1
+        state = []
+        masks = [(0, 0, 0)]
+        # Columns still to try per row, reversed so pop() takes the next one
+        pending = [self._order_columns(ordering, state, 0, 0, 0)[::-1]]
+        nodes = 0
+        self.nodes_visited = 0
+        while pending:
+            options = pending[-1]
+            if not options:
+                pending.pop()
+                masks.pop()
+                if state:
+                    state.pop()
+                continue
+            col = options.pop()
+            state.append(col)
+            nodes += 1
+            self.nodes_visited = nodes
+            if len(state) == n:
+                return state
+            if deadline is not None and not nodes & 0xFFF and time.perf_counter() > deadline:
+                raise SearchTimeout(f'no solution found within the deadline after {nodes} nodes')
+            cols, left, right = masks[-1]
+            bit = 1 << col
+            cols, left, right = cols | bit, ((left | bit) << 1) & full, (right | bit) >> 1
+            masks.append((cols, left, right))
+            pending.append(self._order_columns(ordering, state, cols, left, right)[::-1])
+        return None
+
+    def _order_columns(self, ordering, state, cols, left, right):
+        free = ~(cols | left | right) & ((1 << self.n) - 1)
+        candidates = [col for col in range(self.n) if free >> col & 1]
+        if ordering == 'natural':
+            return candidates
+        if ordering == 'least_constrained':
+            return self._least_constrained(len(state), candidates, cols, left, right)
+        return list(ordering(list(state), candidates))
+
+    def _least_constrained(self, row, candidates, cols, left, right):
+        # Columns that leave the most free squares in the rows below come first. A column that
+        # leaves some later row with no free square at all is dropped (forward checking).
+        full = (1 << self.n) - 1
+        scored = []
+        for col in candidates:
+            bit = 1 << col
+            below_cols, below_left, below_right = cols | bit, (left | bit) << 1, (right | bit) >> 1
+            total = 0
+            for _ in range(self.n - row - 1):
+                free = full & ~(below_cols | below_left | below_right)
+                if not free:
+                    break
+                total += bin(free).count('1')
+                below_left <<= 1
+                below_right >>= 1
+            else:
+                scored.append((-total, col))
+        return [col for _, col in sorted(scored)]
+
+    def complete(self, queens, deadline=None):
+        # A full solution that keeps every given (row, col) queen, or None if they cannot all stay.
+        # deadline is a time.perf_counter() value; SearchTimeout is raised once it passes.
+        n = self.n
+        fixed = {}
+        for row, col in queens:
+            if row in fixed:
+                return None
+            fixed[row] = col
+        full = (1 << n) - 1
+        # Squares each row loses to the given queens, wherever those queens sit
+        blocked = [0] * n
+        for fixed_row, fixed_col in fixed.items():
+            for row in range(n):
+                dist = row - fixed_row
+                if dist:
+                    for col in (fixed_col, fixed_col + dist, fixed_col - dist):
+                        if 0 <= col < n:
+                            blocked[row] |= 1 << col
+        allowed = [0] * n
+        for row in range(n):
+            if row in fixed:
+                bit = 1 << fixed[row]
+                if bit & blocked[row]:
+                    return None  # Two of the given queens attack each other
+                allowed[row] = bit
+            else:
+                allowed[row] = full & ~blocked[row]
+        # Same walk as _iter_bitmask, restricted to the allowed squares of each row
+        state = [0] * n
+        cols = [0] * (n + 1)
+        left = [0] * (n + 1)
+        right = [0] * (n + 1)
+        avail = [0] * (n + 1)
+        avail[0] = allowed[0]
+        last = n - 1
+        row = 0
+        nodes = 0
+        while row >= 0:
+            free = avail[row]
+            if not free:
+                row -= 1
+                continue
+            bit = free & -free
+            avail[row] = free ^ bit
+            state[row] = bit.bit_length() - 1
+            if row == last:
+                return state
+            nodes += 1
+            if deadline is not None and not nodes & 0xFFF and time.perf_counter() > deadline:
+                raise SearchTimeout(f'no completion found within the deadline after {nodes} nodes')
+            nxt = row + 1
+            cols[nxt] = cols[row] | bit
+            left[nxt] = ((left[row] | bit) << 1) & full
+            right[nxt] = (right[row] | bit) >> 1
+            avail[nxt] = allowed[nxt] & ~(cols[nxt] | left[nxt] | right[nxt])
+            row = nxt
+        return None
+
+    def repair(self, queens, seed=None, max_steps=None, deadline=None):
+        # A full solution that keeps every given (row, col) queen, found without a full search:
+        # the constructive solution when it already agrees with the queens, otherwise min-conflicts
+        # repairs that never move them, restarted from a new random board when one gets stuck.
+        # None if the queens attack each other or no solution turned up within REPAIR_RESTARTS runs
+        # of max_steps (or before the deadline, as in complete()); unlike complete(), None does
+        # not prove that the queens cannot all stay.
+        n = self.n
+        fixed = {}
+        for row, col in queens:
+            if row in fixed or not 0 <= col < n:
+                return None
+            fixed[row] = col
+        if len(set(fixed.values())) != len(fixed) or \
+                len({row - col for row, col in fixed.items()}) != len(fixed) or \
+                len({row + col for row, col in fixed.items()}) != len(fixed):
+            return None
+        if n in (2, 3):
+            return None
+        solution = self._construct()
+        if all(solution[row] == col for row, col in fixed.items()):
+            return solution
+        rng = random.Random(seed)
+        for _ in range(REPAIR_RESTARTS):
+            solution = self._min_conflicts(rng.random(), max_steps, fixed, deadline)
+            if solution is not None or (deadline is not None and time.perf_counter() > deadline):
+                return solution
+        return None
+
+    def count(self):
+        # Total number of solutions; nothing is materialized
+        return self.count_symmetric()[1]
+
+    def count_from(self, prefix):
+        # Number of solutions whose first rows are fixed to the given columns
+        if self.engine == 'bitmask':
+            return self._count_bitmask(prefix)
+        return len(self.solve_from(prefix))
+
+    def count_by_first_column(self, tasks=None):
+        # Solutions per column of the first-row queen, from the symmetry-reduced search.
+        # The first-row queens of the 8 images of a board are the queens on its four sides, read
+        # both ways; each distinct variant turns up 8/size times among them, so every class adds
+        # a multiple of 8 to each column and the division is exact for any subset of the tasks.
+        n = self.n
+        last = n - 1
+        weighted = [0] * n
+
+        def tally(board, size):
+            for col in (board[0].bit_length() - 1, board[last].bit_length() - 1,
+                        board.index(1), board.index(1 << last)):
+                weighted[col] += size
+                weighted[last - col] += size
+
+        if tasks is None:
+            tasks = self.symmetry_tasks()
+        for task in tasks:
+            self._run_symmetry_task(task, tally)
+        return [count // 8 for count in weighted]
+
     def _is_valid(self, state, row, col):
         for r, c in enumerate(state):
             if c == col or abs(row - r) == abs(col - c):
@@ -23,4 +286,461 @@ class NQueensSolver:
             if self._is_valid(state, row, col):
                 state.append(col)
                 self._backtrack(state)
-                state.pop() 
\ No newline at end of file
+                state.pop()
+
+    def _construct(self):
+        # Even columns then odd ones (1-based), with fix-ups for the two residues mod 6 where
+        # the plain pattern puts two queens on a diagonal
+        n = self.n
+        evens = list(range(2, n + 1, 2))
+        odds = list(range(1, n + 1, 2))
+        if n % 6 == 2:
+            odds[0], odds[1] = odds[1], odds[0]
+            odds.remove(5)
+            odds.append(5)
+        elif n % 6 == 3:
+            evens.remove(2)
+            evens.append(2)
+            odds = odds[2:] + [1, 3]
+        return [col - 1 for col in evens + odds]
+
+    def _min_conflicts(self, seed=None, max_steps=None, fixed=None, deadline=None):
+        # Starts from a random permutation and keeps moving a random attacked queen to the
+        # least attacked square of its row. Occupancy counters make every move O(n).
+        # fixed maps rows to columns whose queens stay where they are.
+        n = self.n
+        rng = random.Random(seed)
+        if max_steps is None:
+            max_steps = 100 * n
+        if fixed is None:
+            fixed = {}
+        free_cols = [col for col in range(n) if col not in set(fixed.values())]
+        rng.shuffle(free_cols)
+        state = [fixed[row] if row in fixed else 0 for row in range(n)]
+        free_rows = [row for row in range(n) if row not in fixed]
+        for row, col in zip(free_rows, free_cols):
+            state[row] = col
+        cols = [1] * n
+        diag = [0] * (2 * n - 1)
+        anti = [0] * (2 * n - 1)
+        for row, col in enumerate(state):
+            diag[row - col + n - 1] += 1
+            anti[row + col] += 1
+        for _ in range(max_steps):
+            # A pinned queen can only be attacked by a movable one, so those are all that need checking
+            attacked = [row for row in free_rows
+                        if cols[state[row]] + diag[row - state[row] + n - 1] + anti[row + state[row]] > 3]
+            if not attacked:
+                return state
+            if deadline is not None and time.perf_counter() > deadline:
+                return None
+            row = rng.choice(attacked)
+            col = state[row]
+            cols[col] -= 1
+            diag[row - col + n - 1] -= 1
+            anti[row + col] -= 1
+            scores = [cols[c] + diag[row - c + n - 1] + anti[row + c] for c in range(n)]
+            best = min(scores)
+            col = rng.choice([c for c in range(n) if scores[c] == best])
+            state[row] = col
+            cols[col] += 1
+            diag[row - col + n - 1] += 1
+            anti[row + col] += 1
+        return None
+
+    def _prefix_masks(self, prefix):
+        # Occupied columns and diagonals after placing the prefix, as seen from the next row.
+        # Bit i stands for column i; left diagonals shift up a column per row, right ones down.
+        full = (1 << self.n) - 1
+        cols = left = right = 0
+        for col in prefix:
+            if not 0 <= col < self.n:
+                return None
+            bit = 1 << col
+            if bit & (cols | left | right):
+                return None
+            cols |= bit
+            left = ((left | bit) << 1) & full
+            right = (right | bit) >> 1
+        return cols, left, right
+
+    def _iter_bitmask(self, prefix=(), after=None):
+        # Iterative bitmask search; yields solutions in the same order as _backtrack,
+        # starting after the given solution if there is one
+        n = self.n
+        start = len(prefix)
+        masks = self._prefix_masks(prefix)
+        if masks is None:
+            return
+        if start == n:
+            yield list(prefix)
+            return
+        full = (1 << n) - 1
+        state = list(prefix) + [0] * (n - start)
+        cols = [0] * (n + 1)
+        left = [0] * (n + 1)
+        right = [0] * (n + 1)
+        avail = [0] * (n + 1)
+        cols[start], left[start], right[start] = masks
+        avail[start] = full & ~(cols[start] | left[start] | right[start])
+        last = n - 1
+        row = start
+        check = self.cancel_check
+        nodes = 0
+        if after is not None:
+            # Rebuild the search stack as it was when `after` was yielded
+            if len(after) != n or list(after[:start]) != list(prefix):
+                raise ValueError('cursor is not a solution of this search')
+            for row in range(start, n):
+                bit = 1 << after[row]
+                if not 0 <= after[row] < n or not bit & avail[row]:
+                    raise ValueError('cursor is not a solution of this search')
+                state[row] = after[row]
+                avail[row] &= ~((bit << 1) - 1)
+                if row < last:
+                    cols[row + 1] = cols[row] | bit
+                    left[row + 1] = ((left[row] | bit) << 1) & full
+                    right[row + 1] = (right[row] | bit) >> 1
+                    avail[row + 1] = full & ~(cols[row + 1] | left[row + 1] | right[row + 1])
+        while row >= start:
+            free = avail[row]
+            if not free:
+                row -= 1
+                continue
+            nodes += 1
+            if check is not None and not nodes & 0xFFF and check():
+                raise SearchCancelled(f'search cancelled after {nodes} nodes')
+            bit = free & -free
+            avail[row] = free ^ bit
+            state[row] = bit.bit_length() - 1
+            if row == last:
+                yield state[:]
+                continue
+            nxt = row + 1
+            cols[nxt] = cols[row] | bit
+            left[nxt] = ((left[row] | bit) << 1) & full
+            right[nxt] = (right[row] | bit) >> 1
+            avail[nxt] = full & ~(cols[nxt] | left[nxt] | right[nxt])
+            row = nxt
+
+    def _count_bitmask(self, prefix=()):
+        # Same walk as _iter_bitmask, keeping only the running total
+        n = self.n
+        start = len(prefix)
+        masks = self._prefix_masks(prefix)
+        if masks is None:
+            return 0
+        if start == n:
+            return 1
+        full = (1 << n) - 1
+        last = n - 1
+        total = 0
+        check = self.cancel_check
+        nodes = 0
+        stack = [(start, masks[0], masks[1], masks[2])]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            row, cols, left, right = pop()
+            nodes += 1
+            if check is not None and not nodes & 0xFFF and check():
+                raise SearchCancelled(f'search cancelled after {nodes} nodes')
+            free = full & ~(cols | left | right)
+            if row == last:
+                if free:
+                    total += 1
+                continue
+            row += 1
+            while free:
+                bit = free & -free
+                free ^= bit
+                push((row, cols | bit, ((left | bit) << 1) & full, (right | bit) >> 1))
+        return total
+
+    # --- Symmetry-reduced search ---
+    # Only boards that are canonical under the 8 symmetries of the square are searched to the end.
+    # Boards with a queen in a corner are handled by _corner_search, the rest by _edge_search,
+    # which restricts the first queen to the left half of the top row. Each fundamental board is
+    # reported with the size of its symmetry class (2, 4 or 8).
+
+    def symmetry_tasks(self):
+        # Independent pieces of the reduced search, suitable for farming out to worker processes
+        n = self.n
+        if n < 4:
+            return [('small', 0)]
+        tasks = [('corner', bound1) for bound1 in range(2, n - 1)]
+        tasks += [('edge', bound1) for bound1 in range(1, n) if bound1 < n - 1 - bound1]
+        return tasks
+
+    def split_symmetry_tasks(self, depth):
+        # symmetry_tasks() with every search run `depth` rows further, one task per partial board
+        # reached there, for finer-grained parallel work. Such a task is (kind, bound1, start) and
+        # resumes the search from start = (row, left, down, right, queens of the rows above).
+        tasks = []
+        for task in self.symmetry_tasks():
+            kind, bound1 = task
+            if kind == 'small':
+                tasks.append(task)
+                continue
+            first = 2 if kind == 'corner' else 1
+            search = self._corner_search if kind == 'corner' else self._edge_search
+            search(bound1, None, split_row=min(first + depth, self.n - 1),
+                   split=lambda start, kind=kind, bound1=bound1: tasks.append((kind, bound1, start)))
+        return tasks
+
+    def iter_fundamental(self, tasks=None):
+        # Yields (solution, class_size) for one representative of every symmetry class
+        if tasks is None:
+            tasks = self.symmetry_tasks()
+        for task in tasks:
+            found = []
+            self._run_symmetry_task(task, lambda board, size: found.append(([b.bit_length() - 1 for b in board], size)))
+            yield from found
+
+    def fundamental_solutions(self):
+        return [solution for solution, _ in self.iter_fundamental()]
+
+    def count_symmetric(self, tasks=None):
+        # (fundamental, total) solution counts without building any solution lists
+        if tasks is None:
+            tasks = self.symmetry_tasks()
+        counts = [0, 0]
+
+        def tally(board, size):
+            counts[0] += 1
+            counts[1] += size
+
+        for task in tasks:
+            self._run_symmetry_task(task, tally)
+        return counts[0], counts[1]
+
+    def solve_symmetric(self):
+        # Same list as solve(), built from the fundamental solutions
+        solutions = []
+        for solution in self.fundamental_solutions():
+            solutions.extend(self.expand_symmetries(solution))
+        solutions.sort()
+        self.solutions = solutions
+        return solutions
+
+    def expand_symmetries(self, solution):
+        # All distinct rotations and reflections of a solution, the solution itself first
+        n = self.n
+        variants = []
+        seen = set()
+        board = list(solution)
+        for _ in range(4):
+            for variant in (board, [n - 1 - c for c in board]):
+                key = tuple(variant)
+                if key not in seen:
+                    seen.add(key)
+                    variants.append(list(variant))
+            rotated = [0] * n
+            for row, col in enumerate(board):
+                rotated[col] = n - 1 - row
+            board = rotated
+        return variants
+
+    def _run_symmetry_task(self, task, emit):
+        kind, bound1 = task[0], task[1]
+        start = task[2] if len(task) > 2 else None
+        if kind == 'small':
+            self._small_fundamental(emit)
+        elif kind == 'corner':
+            self._corner_search(bound1, emit, start)
+        else:
+            self._edge_search(bound1, emit, start)
+
+    def _small_fundamental(self, emit):
+        # Boards too small for the corner/edge split: keep the smallest variant of each class
+        seen = set()
+        for solution in self._iter_bitmask():
+            variants = self.expand_symmetries(solution)
+            key = min(tuple(v) for v in variants)
+            if key not in seen:
+                seen.add(key)
+                emit([1 << c for c in key], len(variants))
+
+    def _corner_search(self, bound1, emit, start=None, split_row=None, split=None):
+        # Queen in the top-left corner and the second row queen at column bound1.
+        # Keeping row < bound1 off column 1 leaves only one board of each diagonal-mirror pair.
+        # With split_row the search stops there and hands each partial board to split() instead,
+        # in the form start takes to resume it (see split_symmetry_tasks()).
+        n = self.n
+        last = n - 1
+        mask = (1 << n) - 1
+        board = [0] * n
+        board[0] = 1
+        board[1] = bit = 1 << bound1
+        check = self.cancel_check
+        nodes = 0
+
+        def search(row, left, down, right):
+            nonlocal nodes
+            if row == split_row:
+                split((row, left, down, right, tuple(board[:row])))
+                return
+            free = mask & ~(left | down | right)
+            if row == last:
+                if free:
+                    board[row] = free
+                    emit(board, 8)
+                return
+            if check is not None:
+                nodes += 1
+                if not nodes & 0x3FF and check():
+                    raise SearchCancelled(f'search cancelled after {nodes} nodes')
+            if row < bound1:
+                free &= ~2
+            while free:
+                bit = free & -free
+                free ^= bit
+                board[row] = bit
+                search(row + 1, (left | bit) << 1, down | bit, (right | bit) >> 1)
+
+        if start is None:
+            search(2, (2 | bit) << 1, 1 | bit, bit >> 1)
+        else:
+            row, left, down, right, placed = start
+            board[:row] = placed
+            search(row, left, down, right)
+
+    def _edge_search(self, bound1, emit, start=None, split_row=None, split=None):
+        # No queen in any corner; the top row queen at column bound1 in the left half.
+        # The side columns are kept clear up to row bound1 and the last row off the
+        # mirrored corners, then check() compares the board with its rotations.
+        # start, split_row and split work as in _corner_search().
+        n = self.n
+        last = n - 1
+        bound2 = last - bound1
+        mask = (1 << n) - 1
+        topbit = 1 << last
+        sidemask = topbit | 1
+        lastmask = sidemask
+        for _ in range(bound1 - 1):
+            lastmask |= lastmask >> 1 | lastmask << 1
+        endbit = topbit >> bound1
+        board = [0] * n
+        board[0] = bit = 1 << bound1
+        cancel_check = self.cancel_check
+        nodes = 0
+
+        def check():
+            # Class size of the board, or 0 if a rotation of it is searched elsewhere
+            if board[bound2] == 1:
+                own, ptn = 1, 2
+                while own <= last:
+                    bit, you = 1, last
+                    while board[you] != ptn and board[own] >= bit:
+                        bit <<= 1
+                        you -= 1
+                    if board[own] > bit:
+                        return 0
+                    if board[own] < bit:
+                        break
+                    own += 1
+                    ptn <<= 1
+                if own > last:
+                    return 2
+            if board[last] == endbit:
+                own, you = 1, last - 1
+                while own <= last:
+                    bit, ptn = 1, topbit
+                    while ptn != board[you] and board[own] >= bit:
+                        bit <<= 1
+                        ptn >>= 1
+                    if board[own] > bit:
+                        return 0
+                    if board[own] < bit:
+                        break
+                    own += 1
+                    you -= 1
+                if own > last:
+                    return 4
+            if board[bound1] == topbit:
+                own, ptn = 1, topbit >> 1
+                while own <= last:
+                    bit, you = 1, 0
+                    while board[you] != ptn and board[own] >= bit:
+                        bit <<= 1
+                        you += 1
+                    if board[own] > bit:
+                        return 0
+                    if board[own] < bit:
+                        break
+                    own += 1
+                    ptn >>= 1
+            return 8
+
+        def search(row, left, down, right):
+            nonlocal nodes
+            if row == split_row:
+                split((row, left, down, right, tuple(board[:row])))
+                return
+            free = mask & ~(left | down | right)
+            if row == last:
+                if free and not free & lastmask:
+                    board[row] = free
+                    size = check()
+                    if size:
+                        emit(board, size)
+                return
+            if cancel_check is not None:
+                nodes += 1
+                if not nodes & 0x3FF and cancel_check():
+                    raise SearchCancelled(f'search cancelled after {nodes} nodes')
+            if row < bound1:
+                free &= ~sidemask
+            elif row == bound2:
+                if not down & sidemask:
+                    return
+                if down & sidemask != sidemask:
+                    free &= sidemask
+            while free:
+                bit = free & -free
+                free ^= bit
+                board[row] = bit
+                search(row + 1, (left | bit) << 1, down | bit, (right | bit) >> 1)
+
+        if start is None:
+            search(1, bit << 1, bit, bit >> 1)
+        else:
+            row, left, down, right, placed = start
+            board[:row] = placed
+            search(row, left, down, right)
+
+
+class SolutionPager:
+    # Pages through solutions holding at most one page in memory. The source is either a
+    # solver, read lazily through iter_solutions(), or a sequence such as a SolutionStore.
+    # For a solver, the last solution of every page reached so far is kept as the cursor
+    # for the next one.
+    def __init__(self, source, page_size=100):
+        self.source = source
+        self.page_size = page_size
+        self.lazy = hasattr(source, 'iter_solutions')
+        self.total = None if self.lazy else len(source)  # known once the last page has been reached
+        self._cursors = [None]
+
+    def page(self, index):
+        if index < 0:
+            return []
+        if not self.lazy:
+            return list(self.source[index * self.page_size:(index + 1) * self.page_size])
+        solutions = []
+        start = min(index, len(self._cursors) - 1)
+        for page_index in range(start, index + 1):
+            solutions = list(islice(self.source.iter_solutions(self._cursors[page_index]), self.page_size))
+            if len(solutions) < self.page_size:
+                self.total = page_index * self.page_size + len(solutions)
+                return solutions if page_index == index else []
+            if page_index + 1 == len(self._cursors):
+                self._cursors.append(solutions[-1])
+        return solutions
+
+    def has_page(self, index):
+        if index < 0:
+            return False
+        if self.total is None:
+            return True
+        return index * self.page_size < self.total
@@ -0,0 +1,114 @@
+import argparse
+import json
+import sys
+from itertools import islice
+
+try:
+    from .nqueens_ai import FIND_ONE_METHODS, ORDERINGS, NQueensSolver
+    from .nqueens_parallel import count_parallel, enumerate_parallel
+    from .solver_service import SolverService
+except (ImportError, SystemError):
+    from nqueens_ai import FIND_ONE_METHODS, ORDERINGS, NQueensSolver
+    from nqueens_parallel import count_parallel, enumerate_parallel
+    from solver_service import SolverService
+
+FORMATS = ('columns', 'board', 'json')
+
+
+def format_solution(solution, output_format):
+    # columns: the queen's column in each row from the top, 1-based as the game shows them;
+    # board: one line of '.' and 'Q' per row
+    if output_format == 'board':
+        n = len(solution)
+        return '\n'.join('. ' * col + 'Q' + ' .' * (n - 1 - col) for col in solution)
+    return ' '.join(str(col + 1) for col in solution)
+
+
+def write_solutions(solutions, output_format, out):
+    if output_format == 'json':
+        json.dump([list(solution) for solution in solutions], out)
+        out.write('\n')
+        return
+    # Boards are separated by a blank line
+    end = '\n\n' if output_format == 'board' else '\n'
+    for solution in solutions:
+        out.write(format_solution(solution, output_format) + end)
+
+
+def single_core(workers):
+    return workers is not None and workers <= 1
+
+
+def count(n, workers=None):
+    # (total, solutions per first-row column); workers=1 counts in this process
+    if single_core(workers):
+        subtotals = NQueensSolver(n).count_by_first_column()
+        return sum(subtotals), subtotals
+    service = SolverService(workers)
+    try:
+        return count_parallel(service, n)
+    finally:
+        service.shutdown()
+
+
+def enumerate_solutions(n, workers=None, limit=None):
+    # Every solution in lexicographic order. With a limit (or workers=1) they are generated lazily in
+    # this process, so the first ones come back at once even for boards too large to enumerate.
+    if limit is not None or single_core(workers):
+        return islice(NQueensSolver(n).iter_solutions(), limit)
+    service = SolverService(workers)
+    try:
+        return enumerate_parallel(service, n)
+    finally:
+        service.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Solve the N-Queens puzzle from the command line, without the GUI.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    count_parser = commands.add_parser('count', help='number of solutions')
+    enumerate_parser = commands.add_parser('enumerate', help='list every solution')
+    first_parser = commands.add_parser('first', help='find one solution')
+    for command in (count_parser, enumerate_parser, first_parser):
+        command.add_argument('n', type=int, help='board size')
+        command.add_argument('--format', choices=FORMATS, default='columns',
+                             help='columns: 1-based column per row; board: a grid of . and Q; json: 0-based columns')
+    for command in (count_parser, enumerate_parser):
+        command.add_argument('--workers', type=int, default=None,
+                             help='worker processes (default: all cores; 1 solves in this process)')
+    enumerate_parser.add_argument('--limit', type=int, default=None, help='stop after this many solutions')
+    enumerate_parser.add_argument('--output', help='write the solutions to this file instead of stdout')
+    first_parser.add_argument('--method', choices=FIND_ONE_METHODS, default='construct',
+                              help='construct: closed-form O(n); min_conflicts: randomized repair; search: depth-first')
+    first_parser.add_argument('--ordering', choices=ORDERINGS, default='natural', help='column order for --method search')
+    first_parser.add_argument('--seed', type=int, default=None, help='random seed for --method min_conflicts')
+    args = parser.parse_args(argv)
+    if args.n < 1:
+        parser.error('n must be at least 1')
+
+    if args.command == 'count':
+        total, subtotals = count(args.n, args.workers)
+        if args.format == 'json':
+            print(json.dumps({'n': args.n, 'solutions': total, 'by_first_column': subtotals}))
+        else:
+            print(total)
+    elif args.command == 'enumerate':
+        solutions = enumerate_solutions(args.n, args.workers, args.limit)
+        if args.output:
+            with open(args.output, 'w') as f:
+                write_solutions(solutions, args.format, f)
+        else:
+            write_solutions(solutions, args.format, sys.stdout)
+    else:
+        solution = NQueensSolver(args.n).find_one(args.method, seed=args.seed, ordering=args.ordering)
+        if solution is None:
+            print(f'No solution for n={args.n}', file=sys.stderr)
+            sys.exit(1)
+        if args.format == 'json':
+            print(json.dumps(list(solution)))
+        else:
+            print(format_solution(solution, args.format))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1369 @@
+import sys
+import heapq
+import itertools
+import random
+import time
+try:
+    from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QComboBox, QColorDialog, QFrame, QGroupBox, QStatusBar, QMessageBox, QSizePolicy, QProgressBar
+    from PyQt5.QtGui import QMovie, QPixmap, QPainter, QColor, QFont, QIcon
+    from PyQt5.QtCore import Qt, QTimer, QUrl, QRect, pyqtSignal, QThread
+except ImportError as e:
+    raise ImportError('PyQt5 is not installed. Please install it with: pip install PyQt5') from e
+
+try:
+    from .board_model import BoardModel
+    from .hint_engine import HintEngine
+    from .metrics import METRICS, timed
+    from .nqueens_ai import NQueensSolver, SearchCancelled, SearchTimeout, SolutionPager
+    from .nqueens_parallel import add_subtotals, count_tasks, enumerate_tasks, symmetry_chunks
+    from .ai_learning import QLearningAI
+    from .solution_store import SolutionCache, SolutionStore
+    from .solver_service import SolverService, UtilizationReport
+except (ImportError, SystemError):
+    from board_model import BoardModel
+    from hint_engine import HintEngine
+    from metrics import METRICS, timed
+    from nqueens_ai import NQueensSolver, SearchCancelled, SearchTimeout, SolutionPager
+    from nqueens_parallel import add_subtotals, count_tasks, enumerate_tasks, symmetry_chunks
+    from ai_learning import QLearningAI
+    from solution_store import SolutionCache, SolutionStore
+    from solver_service import SolverService, UtilizationReport
+import os
+
+IDLE_ANIMATIONS = [
+    ('happy', 'I love helping you!'),
+    ('thinking', 'I am thinking about queens...'),
+    ('excited', 'This is fun!'),
+    ('neutral', 'Just waiting for your move!'),
+    ('confused', 'What will you do next?'),
+]
+
+ANIMAL_TYPES = ['cat', 'fox', 'dog']
+ANIMAL_SYMBOLS = {'cat': '🐱', 'fox': '🦊', 'dog': '🐶'}
+DARK_BG = '#23272e'
+DARK_PANEL = '#2c313a'
+DARK_ACCENT = '#3c4452'
+DARK_TEXT = '#e0e0e0'
+DARK_GREEN = '#2ecc40'
+DARK_RED = '#e74c3c'
+# Largest board AI Solve enumerates in full into a SolutionStore; bigger boards are browsed lazily
+MAX_STORED_N = 13
+# Largest board for the tree search (AI Solve, Count Solutions); bigger ones use the fast solver
+MAX_SEARCH_N = 20
+# Extra board sizes offered past MAX_SEARCH_N
+LARGE_BOARD_SIZES = [24, 32, 50, 64, 100]
+# Solutions held by the solution browser at a time
+SOLUTION_PAGE_SIZE = 100
+# Seconds "AI Solve (fast)" lets a trained Q-table order its search before building a solution instead
+LEARNED_SOLVE_BUDGET = 0.1
+
+class EffectScheduler:
+    # Expiry times of every running board effect in one heap, served by a single timer that
+    # is always armed for the earliest one. on_expire(key) is called as each effect runs out.
+    def __init__(self, parent, on_expire):
+        self.on_expire = on_expire
+        self._heap = []  # (expires at, sequence, key)
+        self._sequence = itertools.count()
+        self.timer = QTimer(parent)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._expire)
+
+    def schedule(self, key, duration):
+        # duration in milliseconds
+        heapq.heappush(self._heap, (time.monotonic() + duration / 1000, next(self._sequence), key))
+        self._arm()
+
+    def clear(self):
+        self._heap = []
+        self.timer.stop()
+
+    def _arm(self):
+        if not self._heap:
+            self.timer.stop()
+            return
+        delay = max(0, int((self._heap[0][0] - time.monotonic()) * 1000))
+        if not self.timer.isActive() or self.timer.remainingTime() > delay:
+            self.timer.start(delay)
+
+    def _expire(self):
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key = heapq.heappop(self._heap)
+            self.on_expire(key)
+        self._arm()
+
+
+class StartupReport:
+    # Time from launch to the first paint of the board, split into the steps in between
+    def __init__(self, launched):
+        self.marks = [('launch', launched)]
+
+    def mark(self, step):
+        self.marks.append((step, time.perf_counter()))
+
+    def format(self):
+        total = (self.marks[-1][1] - self.marks[0][1]) * 1000
+        steps = ', '.join(f'{step} {(at - before) * 1000:.0f} ms'
+                          for (_, before), (step, at) in zip(self.marks, self.marks[1:]))
+        return f'Startup: first paint after {total:.0f} ms ({steps})'
+
+
+class SoundBank:
+    # One sound effect per emotion of the current animal, from assets/<animal>/<emotion>.wav. Each
+    # animal's whole set is found with one directory listing and decoded once, when the animal is
+    # first used; play() then only starts an effect that is already loaded, and switching back to an
+    # animal reuses its set. QtMultimedia is imported with the first set.
+    def __init__(self, parent, animal, directory='assets', volume=0.5):
+        self.parent = parent
+        self.animal = animal
+        self.directory = directory
+        self.volume = volume
+        self.sets = {}  # animal -> {emotion: QSoundEffect}
+        self.current = None  # The set of self.animal, once loaded
+        self.playing = None
+
+    def use(self, animal):
+        self.animal = animal
+        if animal not in self.sets:
+            self.sets[animal] = self.load(animal)
+        self.current = self.sets[animal]
+
+    def load(self, animal):
+        from PyQt5.QtMultimedia import QSoundEffect
+        folder = os.path.join(self.directory, animal)
+        try:
+            names = sorted(os.listdir(folder))
+        except OSError:
+            return {}  # No sounds for this animal
+        effects = {}
+        for name in names:
+            emotion, extension = os.path.splitext(name)
+            if extension.lower() != '.wav':
+                continue
+            effect = QSoundEffect(self.parent)
+            effect.setSource(QUrl.fromLocalFile(os.path.abspath(os.path.join(folder, name))))
+            effect.setVolume(self.volume)
+            effects[emotion] = effect
+        return effects
+
+    def play(self, emotion):
+        if self.current is None:
+            self.use(self.animal)
+        effect = self.current.get(emotion)
+        if effect is None:
+            return
+        # One voice at a time, as with a single shared effect: a new emotion cuts off the last one
+        if self.playing is not None and self.playing is not effect:
+            self.playing.stop()
+        effect.play()
+        self.playing = effect
+
+
+class BoardWidget(QWidget):
+    place_message = pyqtSignal(bool, str)  # True/False, reason
+    solved_signal = pyqtSignal()  # Signal to notify when solved
+    board_changed = pyqtSignal()  # Any queen placed or removed
+    first_painted = pyqtSignal()  # The board has been drawn for the first time
+    def __init__(self, n=8, animal_type='cat', parent=None):
+        super().__init__(parent)
+        self.n = n
+        self.animal_type = animal_type
+        self.setMinimumSize(400, 400)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.queen_color = QColor(0, 0, 0)  # Default queen color: black
+        self.queen_symbol = ANIMAL_SYMBOLS.get(self.animal_type, '♛')
+        self.symbol_pixmaps = {}  # symbol size -> pixmap of the current symbol and color
+        self.board_pixmap = None  # Checkerboard without overlays, redrawn only when its size or colors change
+        self.model = BoardModel(self.n)  # Queens plus row/column/diagonal occupancy counters
+        self.user_state = [None] * self.n
+        self.invalid_flashes = []  # List of (row, col) to flash red
+        self.valid_flash = None    # (row, col) to flash green
+        self.effects = EffectScheduler(self, self.expire_effect)  # One timer for every flash and highlight
+        self.hint_generation = 0  # Lets an old highlight's expiry ignore a newer hint
+        self.repaint_count = 0  # paintEvents so far, sampled by the window's repaints/s counter
+        self.hint_highlights = set()  # (row, col) squares highlighted for a hint
+        # Dark theme board colors
+        self.bg_color1 = QColor(60, 65, 82)
+        self.bg_color2 = QColor(44, 49, 58)
+
+    @property
+    def queens(self):
+        # (row, col) tuples in placement order
+        return self.model.queens
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # checkerboard() rebuilds on the next paint only if the cell size changed; symbols are cached per size
+        self.update()
+
+    def set_queen_color(self, color):
+        self.queen_color = color
+        self.symbol_pixmaps = {}
+        self.update()
+
+    def symbol_pixmap(self, symbol_size):
+        pixmap = self.symbol_pixmaps.get(symbol_size)
+        if pixmap is None:
+            pixmap = self.symbol_pixmaps[symbol_size] = self.create_symbol_pixmap(symbol_size)
+        return pixmap
+
+    def create_symbol_pixmap(self, symbol_size):
+        pixmap = QPixmap(symbol_size, symbol_size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setPen(self.queen_color)
+        font = self.font()
+        font.setPointSize(max(1, symbol_size // 2))  # Adjust font size proportionally
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, self.queen_symbol)
+        painter.end()
+        return pixmap
+
+    def set_animal_type(self, animal_type):
+        self.animal_type = animal_type
+        self.queen_symbol = ANIMAL_SYMBOLS.get(self.animal_type, '♛')
+        self.symbol_pixmaps = {}
+        self.update()
+
+    def set_bg_colors(self, color1, color2):
+        self.bg_color1 = color1
+        self.bg_color2 = color2
+        self.board_pixmap = None
+        self.update()
+
+    def cell_rect(self, row, col):
+        size = min(self.width(), self.height())
+        cell_size = size // self.n
+        x_offset = (self.width() - size) // 2
+        y_offset = (self.height() - size) // 2
+        return QRect(x_offset + col * cell_size, y_offset + row * cell_size, cell_size, cell_size)
+
+    def update_cells(self, squares):
+        # Repaint just these squares instead of the whole widget
+        for row, col in squares:
+            self.update(self.cell_rect(row, col))
+
+    def set_hint_highlights(self, squares, duration=7000):
+        self.update_cells(self.hint_highlights)
+        self.hint_highlights = set(squares)
+        self.update_cells(self.hint_highlights)
+        self.hint_generation += 1
+        self.effects.schedule(('hint', self.hint_generation), duration)
+
+    def clear_hint_highlights(self):
+        self.update_cells(self.hint_highlights)
+        self.hint_highlights = set()
+
+    def flash_valid(self, row, col, duration=300):
+        if self.valid_flash is not None:
+            self.update_cells([self.valid_flash])
+        self.valid_flash = (row, col)
+        self.update_cells([(row, col)])
+        self.effects.schedule(('valid', (row, col)), duration)
+
+    def expire_effect(self, key):
+        kind, value = key
+        if kind == 'invalid':
+            self.remove_invalid_flash(*value)
+        elif kind == 'valid' and self.valid_flash == value:
+            self.clear_valid_flash()
+        elif kind == 'hint' and value == self.hint_generation:
+            self.clear_hint_highlights()
+
+    @timed('click')
+    def mousePressEvent(self, event):
+        # Make the board always square and centered
+        size = min(self.width(), self.height())
+        x_offset = (self.width() - size) // 2
+        y_offset = (self.height() - size) // 2
+        cell_size = size // self.n
+        x = event.x() - x_offset
+        y = event.y() - y_offset
+        if x < 0 or y < 0 or x >= size or y >= size:
+            return  # Click outside the board
+        col = x // cell_size
+        row = y // cell_size
+        if row < self.n and col < self.n:
+            # Remove queen if present
+            if (row, col) in self.model:
+                self.model.remove(row, col)
+                self.update_cells([(row, col)])
+                self.board_changed.emit()
+                self.check_solved()
+                return
+            # Place queen if not already present and under N queens
+            if len(self.model) < self.n:
+                valid, reason = self.is_valid(row, col)
+                self.model.place(row, col)
+                if valid:
+                    self.flash_valid(row, col)
+                    self.place_message.emit(True, '')
+                else:
+                    self.add_invalid_flash(row, col)
+                    self.place_message.emit(False, reason)
+                self.board_changed.emit()
+                self.check_solved()
+
+    def add_invalid_flash(self, row, col, duration=1500):
+        # Flash the square red; each flash expires on its own, so repeated clicks stack
+        self.invalid_flashes.append((row, col))
+        self.effects.schedule(('invalid', (row, col)), duration)
+        self.update_cells([(row, col)])
+
+    def remove_invalid_flash(self, row, col):
+        if (row, col) in self.invalid_flashes:
+            self.invalid_flashes.remove((row, col))
+        self.update_cells([(row, col)])
+
+    def clear_valid_flash(self):
+        if self.valid_flash is not None:
+            self.update_cells([self.valid_flash])
+        self.valid_flash = None
+
+    def is_valid(self, row, col):
+        return self.model.is_valid(row, col)
+
+    @timed('paint')
+    def paintEvent(self, event):
+        self.repaint_count += 1
+        painter = QPainter(self)
+        # Make the board always square and centered
+        size = min(self.width(), self.height())
+        x_offset = (self.width() - size) // 2
+        y_offset = (self.height() - size) // 2
+        cell_size = size // self.n
+        painter.drawPixmap(x_offset, y_offset, self.checkerboard(cell_size))
+        # Overlays, weakest first so an invalid flash wins over a hint on the same square
+        overlays = [(self.hint_highlights, QColor(255, 255, 100)),
+                    ([self.valid_flash] if self.valid_flash else [], QColor(80, 255, 80)),
+                    (self.invalid_flashes, QColor(255, 80, 80))]
+        for squares, color in overlays:
+            for row, col in squares:
+                painter.fillRect(x_offset + col * cell_size, y_offset + row * cell_size, cell_size, cell_size, color)
+        # Draw queens
+        symbol_size = max(1, min(32, cell_size - 4))  # Ensure symbol fits in cell with padding
+        pixmap = self.symbol_pixmap(symbol_size)
+        for row, col in self.model:
+            x = x_offset + col * cell_size + (cell_size - symbol_size) // 2
+            y = y_offset + row * cell_size + (cell_size - symbol_size) // 2
+            painter.drawPixmap(x, y, pixmap)
+        painter.end()
+        if self.repaint_count == 1:
+            self.first_painted.emit()
+
+    def checkerboard(self, cell_size):
+        # The n x n squares drawn once into a pixmap, reused by every repaint at this size
+        side = cell_size * self.n
+        if self.board_pixmap is None or self.board_pixmap.width() != side:
+            self.board_pixmap = QPixmap(max(1, side), max(1, side))
+            painter = QPainter(self.board_pixmap)
+            for row in range(self.n):
+                for col in range(self.n):
+                    color = self.bg_color1 if (row + col) % 2 == 0 else self.bg_color2
+                    painter.fillRect(col * cell_size, row * cell_size, cell_size, cell_size, color)
+            painter.end()
+        return self.board_pixmap
+
+    def reset_board(self):
+        self.model.clear()
+        self.user_state = [None] * self.n
+        self.effects.clear()
+        self.invalid_flashes = []
+        self.valid_flash = None
+        self.hint_highlights = set()
+        self.update()
+        self.board_changed.emit()
+
+    def set_board(self, queens):
+        self.model = BoardModel(self.n, queens)
+        self.user_state = list(queens)
+        self.effects.clear()
+        self.invalid_flashes = []
+        self.valid_flash = None
+        self.hint_highlights = set()
+        self.update()
+        self.board_changed.emit()
+
+    def check_solved(self):
+        # Check if the board is solved: N queens, none attacking another
+        if self.model.is_solved():
+            self.solved_signal.emit()
+
+class SolveWorker(QThread):
+    # Runs one batch of pool tasks off the GUI thread and streams results back through signals
+    progress = pyqtSignal(int, int)  # subtrees done, total subtrees
+    partial_result = pyqtSignal(object, object)  # task args, task result
+    finished_result = pyqtSignal(list)  # [(task args, task result), ...]
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, service, fn, tasks, parent=None):
+        super().__init__(parent)
+        self.service = service
+        self.fn = fn
+        self.tasks = list(tasks)
+        self.report = UtilizationReport(service.max_workers)
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+        self.service.cancel()
+
+    def run(self):
+        from concurrent.futures import CancelledError
+        self.service.begin_job()
+        results = []
+        self.progress.emit(0, len(self.tasks))
+        try:
+            for args, result in self.service.map_unordered(self.fn, self.tasks, self.report):
+                if self._cancel_requested:
+                    break
+                results.append((args, result))
+                self.partial_result.emit(args, result)
+                self.progress.emit(len(results), len(self.tasks))
+        except CancelledError:
+            pass
+        except Exception as e:
+            if not self._cancel_requested:
+                self.failed.emit(str(e))
+                return
+        if self._cancel_requested:
+            self.cancelled.emit()
+        else:
+            self.finished_result.emit(results)
+
+class PageWorker(QThread):
+    # Generates one page of a lazy SolutionPager off the GUI thread; a page of 100 takes over a
+    # second at 20x20. Cancelling stops the search at its next cancel check.
+    page_ready = pyqtSignal(object, int, list, object)  # pager, page index, solutions, solution to show
+
+    def __init__(self, pager, page_index, show, parent=None):
+        super().__init__(parent)
+        self.pager = pager
+        self.page_index = page_index
+        self.show = show
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def run(self):
+        self.pager.source.cancel_check = lambda: self._cancel_requested
+        try:
+            solutions = self.pager.page(self.page_index)
+        except SearchCancelled:
+            return
+        self.page_ready.emit(self.pager, self.page_index, solutions, self.show)
+
+class MainWindow(QMainWindow):
+    completion_index_ready = pyqtSignal(int)  # Board size; emitted from the HintEngine's build thread
+
+    def __init__(self):
+        super().__init__()
+        # Initialize core attributes first
+        self.n = 8
+        self.animal_type = 'cat'
+        self.solver = NQueensSolver(self.n)
+        self.solution_cache = SolutionCache()
+        self.completion_index_ready.connect(self.refresh_completion_status)
+        self.hint_engine = self.new_hint_engine()
+        self._ai = None  # QLearningAI for this size, created (and its Q-table read) on first use
+        self.solutions = []  # Current page of the solution browser
+        self.current_solution_idx = 0
+        self.pager = None
+        self.page_index = 0
+        self.solution_total = None
+        self.solver_worker = None
+        self.page_worker = None  # PageWorker generating a page of solutions, if any
+        self.solver_service = SolverService()  # Worker pool, started on first multi-core solve
+        self.is_solved = False
+        
+        # Window setup
+        self.setWindowTitle('N-Queens AI Animal Game')
+        self.setGeometry(100, 100, 1000, 700)
+        self.setMinimumSize(800, 600)  # Set minimum window size
+        self.setStyleSheet(f"""
+            QMainWindow {{
+                background: {DARK_BG};
+                color: {DARK_TEXT};
+            }}
+            QWidget {{
+                background: {DARK_BG};
+                color: {DARK_TEXT};
+            }}
+            QGroupBox {{
+                background: {DARK_PANEL};
+                color: {DARK_TEXT};
+                border-radius: 8px;
+                border: 1px solid {DARK_ACCENT};
+                margin-top: 1em;
+                padding-top: 1em;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 3px;
+            }}
+            QPushButton {{
+                background: {DARK_ACCENT};
+                color: #fff;
+                padding: 8px;
+                border-radius: 8px;
+                font-weight: bold;
+                min-height: 30px;
+                border: none;
+            }}
+            QPushButton:checked, QPushButton:pressed {{
+                background: {DARK_GREEN};
+                color: #fff;
+            }}
+            QPushButton:disabled {{
+                background: #444;
+                color: #888;
+            }}
+            QPushButton:hover:!disabled {{
+                background: #444b5a;
+            }}
+            QComboBox, QComboBox QAbstractItemView {{
+                background: {DARK_PANEL};
+                color: {DARK_TEXT};
+                border-radius: 6px;
+                min-height: 30px;
+                selection-background-color: {DARK_ACCENT};
+                selection-color: #fff;
+            }}
+            QComboBox QAbstractItemView {{
+                border: 1px solid {DARK_ACCENT};
+                selection-background-color: {DARK_GREEN};
+                selection-color: #fff;
+            }}
+            QComboBox::drop-down {{
+                background: {DARK_ACCENT};
+                border-left: 1px solid {DARK_ACCENT};
+            }}
+            QComboBox::down-arrow {{
+                image: none;
+                border: none;
+                width: 0;
+                height: 0;
+            }}
+            QLabel {{
+                background: transparent;
+                color: {DARK_TEXT};
+                padding: 4px;
+            }}
+            QStatusBar {{
+                background: {DARK_ACCENT};
+                color: {DARK_TEXT};
+                font-size: 14px;
+                padding: 5px;
+                border-top: 1px solid {DARK_PANEL};
+            }}
+            QScrollBar:vertical, QScrollBar:horizontal {{
+                background: {DARK_PANEL};
+                border: none;
+                width: 12px;
+                margin: 0px;
+            }}
+            QScrollBar::handle:vertical, QScrollBar::handle:horizontal {{
+                background: {DARK_ACCENT};
+                min-height: 20px;
+                border-radius: 6px;
+            }}
+            QScrollBar::add-line, QScrollBar::sub-line {{
+                background: none;
+                border: none;
+            }}
+            QMessageBox {{
+                background-color: {DARK_PANEL};
+                color: {DARK_TEXT};
+                border: 2px solid {DARK_GREEN};
+            }}
+            QMessageBox QLabel {{
+                color: {DARK_GREEN};
+                font-size: 18px;
+            }}
+        """)
+        
+        # Central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout()
+        main_layout.setSpacing(20)  # Increased spacing between elements
+        central_widget.setLayout(main_layout)
+        
+        # Header with app name and animal icon row
+        header = QHBoxLayout()
+        header.setSpacing(20)
+        title = QLabel('N-Queens AI Animal Game')
+        title.setFont(QFont('Segoe UI', 24, QFont.Bold))
+        title.setStyleSheet(f'color: {DARK_GREEN}; padding: 10px;')
+        header.addWidget(title)
+        header.addStretch()
+        
+        # Animal icon choice row (for queen icon)
+        self.animal_buttons = {}
+        icon_row = QHBoxLayout()
+        icon_row.setSpacing(10)
+        for animal in ANIMAL_TYPES:
+            btn = QPushButton(ANIMAL_SYMBOLS[animal])
+            btn.setCheckable(True)
+            btn.setFixedSize(50, 50)  # Fixed size for animal buttons
+            btn.setStyleSheet(f"""
+                font-size: 28px;
+                background: {DARK_PANEL};
+                color: {DARK_TEXT};
+                border-radius: 10px;
+                padding: 6px;
+            """)
+            btn.clicked.connect(lambda checked, a=animal: self.change_animal(a))
+            icon_row.addWidget(btn)
+            self.animal_buttons[animal] = btn
+        self.animal_buttons[self.animal_type].setChecked(True)
+        header.addLayout(icon_row)
+        main_layout.addLayout(header)
+        
+        # Main content area
+        content = QHBoxLayout()
+        content.setSpacing(30)  # Increased spacing between board and controls
+        main_layout.addLayout(content)
+        
+        # Board frame with shadow
+        board_frame = QFrame()
+        board_frame.setStyleSheet(f"""
+            background: {DARK_PANEL};
+            border-radius: 16px;
+            border: 2px solid {DARK_ACCENT};
+        """)
+        board_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.board_layout = QVBoxLayout()
+        self.board_layout.setSpacing(0)
+        self.board_layout.setContentsMargins(0, 0, 0, 0)
+        board_frame.setLayout(self.board_layout)
+        self.board_widget = BoardWidget(self.n, self.animal_type)
+        self.board_layout.addWidget(self.board_widget)
+        
+        # Next solution button
+        self.next_solution_btn = QPushButton('Show Next Solution')
+        self.next_solution_btn.setIcon(QIcon.fromTheme('go-down') or QIcon(''))
+        self.next_solution_btn.setStyleSheet(f"""
+            font-size: 16px;
+            background: {DARK_ACCENT};
+            color: {DARK_GREEN};
+            border-radius: 8px;
+            padding: 10px;
+            min-height: 40px;
+        """)
+        self.next_solution_btn.clicked.connect(self.show_next_solution)
+        self.next_solution_btn.setVisible(False)
+        self.board_layout.addWidget(self.next_solution_btn)
+        
+        # Add board frame to content with stretch
+        content.addWidget(board_frame, stretch=2)
+        
+        # Right panel for controls and info
+        right_panel = QVBoxLayout()
+        right_panel.setSpacing(20)
+        content.addLayout(right_panel, stretch=1)
+        
+        # Board size selector
+        size_group = QGroupBox('Board Size')
+        size_layout = QVBoxLayout()
+        size_layout.setSpacing(10)
+        self.size_selector = QComboBox()
+        solvable_ns = [str(i) for i in list(range(4, MAX_SEARCH_N + 1)) + LARGE_BOARD_SIZES if i not in (2, 3)]
+        self.size_selector.addItems(solvable_ns)
+        self.size_selector.setCurrentText(str(self.n))
+        self.size_selector.currentTextChanged.connect(self.change_board_size)
+        size_layout.addWidget(self.size_selector)
+        size_group.setLayout(size_layout)
+        right_panel.addWidget(size_group)
+        
+        # Speech bubble
+        self.speech_label = QLabel(f'{ANIMAL_SYMBOLS[self.animal_type]} Hello! I am your animal AI friend!')
+        self.speech_label.setAlignment(Qt.AlignCenter)
+        self.speech_label.setWordWrap(True)  # Enable word wrap
+        self.speech_label.setStyleSheet(f"""
+            font-size: 18px;
+            background: {DARK_BG};
+            border-radius: 10px;
+            padding: 15px;
+            color: #fffbe6;
+            min-height: 60px;
+        """)
+        right_panel.addWidget(self.speech_label)
+        
+        # Controls group
+        controls_group = QGroupBox('Controls')
+        controls_layout = QVBoxLayout()
+        controls_layout.setSpacing(12)
+        
+        self.hint_button = QPushButton('Hint')
+        self.hint_button.setStyleSheet(f'background: {DARK_GREEN}; color: #fff;')
+        self.hint_button.clicked.connect(self.give_hint)
+        controls_layout.addWidget(self.hint_button)
+        
+        self.solve_button = QPushButton('AI Solve')
+        self.solve_button.setStyleSheet(f'background: {DARK_ACCENT}; color: #fff;')
+        self.solve_button.clicked.connect(self.solve_board)
+        controls_layout.addWidget(self.solve_button)
+        
+        self.fast_solve_button = QPushButton('AI Solve (fast)')
+        self.fast_solve_button.setStyleSheet(f'background: {DARK_ACCENT}; color: #fff;')
+        self.fast_solve_button.clicked.connect(self.solve_fast)
+        controls_layout.addWidget(self.fast_solve_button)
+        
+        self.count_button = QPushButton('Count Solutions')
+        self.count_button.setStyleSheet(f'background: {DARK_ACCENT}; color: #fff;')
+        self.count_button.clicked.connect(self.count_solutions)
+        controls_layout.addWidget(self.count_button)
+        
+        self.cancel_button = QPushButton('Cancel')
+        self.cancel_button.setStyleSheet(f'background: {DARK_RED}; color: #fff;')
+        self.cancel_button.clicked.connect(self.cancel_solve)
+        self.cancel_button.setVisible(False)
+        controls_layout.addWidget(self.cancel_button)
+        
+        self.reset_button = QPushButton('Reset')
+        self.reset_button.setStyleSheet(f'background: {DARK_RED}; color: #fff;')
+        self.reset_button.clicked.connect(self.reset_board)
+        controls_layout.addWidget(self.reset_button)
+        
+        self.color_button = QPushButton('Change Board Colors')
+        self.color_button.setStyleSheet(f'background: {DARK_ACCENT}; color: #fff;')
+        self.color_button.clicked.connect(self.pick_board_colors)
+        controls_layout.addWidget(self.color_button)
+        
+        controls_group.setLayout(controls_layout)
+        right_panel.addWidget(controls_group)
+        
+        # Solution selector
+        self.solution_selector = QComboBox()
+        self.solution_selector.currentIndexChanged.connect(self.select_solution)
+        self.solution_selector.setStyleSheet(f'background: {DARK_PANEL}; color: {DARK_TEXT};')
+        right_panel.addWidget(self.solution_selector)
+        
+        right_panel.addStretch()
+        
+        # Status bar
+        self.status = QStatusBar()
+        self.status.setStyleSheet(f"""
+            background: {DARK_ACCENT};
+            color: {DARK_TEXT};
+            font-size: 14px;
+            padding: 5px;
+        """)
+        self.setStatusBar(self.status)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setFormat('%v/%m subtrees')
+        self.progress_bar.setVisible(False)
+        self.status.addPermanentWidget(self.progress_bar)
+        self.completion_label = QLabel()  # How many ways the current queens can still be finished
+        self.status.addPermanentWidget(self.completion_label)
+        self.repaint_label = QLabel('0 repaints/s')
+        self.status.addPermanentWidget(self.repaint_label)
+        self.repaint_timer = QTimer()
+        self.repaint_timer.setInterval(1000)
+        self.repaint_timer.timeout.connect(self.update_repaint_rate)
+        self.repaint_timer.timeout.connect(self.update_metrics_overlay)
+        self.repaint_timer.start()
+        self.last_repaint_count = 0
+        # Metrics overlay: p50/p95 of every timer and the rate of every counter, refreshed each second
+        self.metrics_label = QLabel()
+        self.metrics_label.setVisible(METRICS.enabled)
+        self.status.addPermanentWidget(self.metrics_label)
+        self.metrics_button = QPushButton('Metrics')
+        self.metrics_button.setCheckable(True)
+        self.metrics_button.setChecked(METRICS.enabled)
+        self.metrics_button.toggled.connect(self.toggle_metrics)
+        self.status.addPermanentWidget(self.metrics_button)
+        self.export_metrics_button = QPushButton('Export')
+        self.export_metrics_button.setVisible(METRICS.enabled)
+        self.export_metrics_button.clicked.connect(self.export_metrics)
+        self.status.addPermanentWidget(self.export_metrics_button)
+        self.status.showMessage('Ready to play!')
+        
+        # Connect signals
+        self.board_widget.place_message.connect(self.show_place_message)
+        self.board_widget.solved_signal.connect(self.show_congratulations)
+        self.board_widget.board_changed.connect(self.update_completion_status)
+        self.update_completion_status()
+        
+        # Sounds, loaded once the board is on screen so decoding them does not delay the window
+        self.sounds = SoundBank(self, self.animal_type)
+        self.board_widget.first_painted.connect(self.preload_sounds)
+        
+        # Idle timer
+        self.idle_timer = QTimer()
+        self.idle_timer.setInterval(8000)
+        self.idle_timer.timeout.connect(self.idle_animation)
+        self.idle_timer.start()
+        
+        # Reset idle timer on user interaction
+        for btn in [self.hint_button, self.solve_button, self.fast_solve_button, self.count_button, self.reset_button,
+                   self.solution_selector, self.size_selector, self.color_button]:
+            btn.installEventFilter(self)
+        self.board_widget.installEventFilter(self)
+        
+        # Highlight selected animal button
+        self.update_animal_buttons()
+
+    def new_hint_engine(self):
+        # Its completion index builds in the background; the status line refreshes once it is ready
+        engine = HintEngine(self.n, solution_cache=self.solution_cache, on_index_ready=self.completion_index_ready.emit)
+        engine.prepare()
+        return engine
+
+    def refresh_completion_status(self, n):
+        if n == self.n:
+            self.update_completion_status()
+
+    @property
+    def ai(self):
+        if self._ai is None:
+            self._ai = QLearningAI(self.n)
+        return self._ai
+
+    def preload_sounds(self):
+        if self.sounds.current is None:
+            self.sounds.use(self.animal_type)
+
+    def play_sound(self, emotion):
+        self.sounds.play(emotion)
+
+    def set_animal_emotion(self, emotion, message, duration=2000):
+        # Just show the message, no animal symbol
+        self.speech_label.setText(message)
+        self.play_sound(emotion)
+        self.idle_timer.start()
+        # Return to neutral after duration
+        if emotion != 'neutral':
+            QTimer.singleShot(duration, lambda: self.set_animal_emotion('neutral', 'Ready for your next move!'))
+
+    def board_is_solved(self):
+        return self.board_widget.model.is_solved()
+
+    def give_hint(self):
+        if self.is_solved or self.board_is_solved():
+            self.set_animal_emotion('happy', '🎉 The board is already solved! Great job!', duration=4000)
+            self.status.showMessage('Board is already solved!')
+            self.board_widget.set_hint_highlights([])
+            return
+        # Only suggest moves that can still be completed to a full solution
+        with METRICS.timer('hint'):
+            hint = self.hint_engine.suggest(self.board_widget.queens)
+        unsure = '' if hint.guaranteed else ' (I did not have time to check it all the way!)'
+        if hint.kind == 'place':
+            row, col = hint.squares[0]
+            self.board_widget.model.place(row, col)
+            self.board_widget.flash_valid(row, col)
+            self.board_widget.board_changed.emit()
+            ways = self.hint_engine.completions(self.board_widget.queens)
+            if ways is not None:
+                unsure = f" ({ways} way{'s' if ways != 1 else ''} to finish from there)"
+            self.set_animal_emotion('thinking', f'Hint: Try placing at row {row+1}, col {col+1}!{unsure}', duration=7000)
+            self.board_widget.set_hint_highlights([(row, col)], duration=7000)
+            self.board_widget.check_solved()
+        elif hint.kind == 'move':
+            (qrow, qcol), (new_row, new_col) = hint.squares
+            msg = f"This can't be finished as it is! Try moving queen from row {qrow+1}, col {qcol+1} to row {new_row+1}, col {new_col+1}."
+            self.set_animal_emotion('confused', msg, duration=7000)
+            self.board_widget.set_hint_highlights(hint.squares, duration=7000)
+        elif hint.kind == 'remove':
+            msg = "This can't be finished as it is! Try removing queen(s) at: "
+            msg += ', '.join([f'row {r+1}, col {c+1}' for r, c in hint.squares])
+            self.set_animal_emotion('confused', msg, duration=7000)
+            self.board_widget.set_hint_highlights(hint.squares, duration=7000)
+        elif hint.kind == 'solved':
+            self.set_animal_emotion('happy', '🎉 The board is already solved! Great job!', duration=4000)
+        else:
+            self.set_animal_emotion('surprised', 'No valid moves! Try removing one or more queens to continue.', duration=7000)
+            self.board_widget.set_hint_highlights([], duration=7000)
+
+    def solve_board(self):
+        if self.n > MAX_SEARCH_N:
+            # Far beyond what the tree search can do; just build one solution
+            self.solve_fast()
+            return
+        self.board_widget.set_board([])
+        self.solutions = []
+        self.current_solution_idx = 0
+        self.is_solved = False
+        self.hint_button.setDisabled(True)
+        self.solve_button.setDisabled(True)
+        self.status.showMessage('Solving N-Queens puzzle...')
+        self.set_animal_emotion('thinking', 'Solving... Please wait!')
+
+        # Boards solved before come straight from the on-disk cache. Otherwise only the first solution
+        # is found here, so it shows right away; the rest of its page is generated on a PageWorker.
+        with METRICS.timer('solve'):
+            store = self.solution_cache.load(self.n)
+            if store is not None:
+                self.pager = SolutionPager(store, SOLUTION_PAGE_SIZE)
+                self.load_solution_page(0)
+            else:
+                # The pager gets a solver of its own, since its pages are generated on another thread
+                self.pager = SolutionPager(NQueensSolver(self.n), SOLUTION_PAGE_SIZE)
+                first = next(self.solver.iter_solutions(), None)
+                if first is not None:
+                    self.set_solution_page(0, [first])
+                    self.turn_page(0, show=None)
+            self.solution_total = self.pager.total
+        counting = self.solution_total is None and self.n <= MAX_STORED_N and self.start_enumerate_job(self.solve_enumerated)
+        if self.solutions:
+            self.show_solution(0, announce=False)
+            self.next_solution_btn.setVisible(self.has_more_solutions())
+            if counting:
+                self.set_animal_emotion('excited', 'Here is a solution! Let me count the others...')
+            elif self.solution_total is None:
+                self.set_animal_emotion('excited', 'Here is a solution, and there are lots more!')
+            elif self.solution_total > 1:
+                self.set_animal_emotion('excited', f'I found {self.solution_total:,} solutions!')
+            else:
+                self.set_animal_emotion('happy', 'I solved it for you!')
+            self.show_congratulations()
+        else:
+            msg = QMessageBox(self)
+            msg.setWindowTitle('No Solution')
+            msg.setText('No solution exists for this board.')
+            msg.setIcon(QMessageBox.Warning)
+            msg.setStyleSheet('QLabel{color: #e74c3c; font-size: 18px;} QMessageBox{background-color: #232; border: 2px solid #e74c3c;}')
+            msg.exec_()
+            self.set_animal_emotion('sad', 'No solutions from here!')
+        self.hint_button.setDisabled(False)
+        self.solve_button.setDisabled(False)
+        if self.solution_total is not None:
+            self.status.showMessage(f'Found {self.solution_total:,} solutions!')
+        elif not counting:
+            self.status.showMessage('Found solutions! Use "Count Solutions" for the total.')
+
+    def solve_fast(self):
+        # One solution without enumerating: a short search ordered by the trained Q-table when this
+        # size has one (see train_ai.py), else the closed-form construction, O(n) even on the largest boards
+        self.is_solved = False
+        self.pager = None
+        self.solutions = []
+        self.solution_total = None
+        self.solution_selector.clear()
+        self.next_solution_btn.setVisible(False)
+        solution = self.learned_solution()
+        if solution is not None:
+            self.board_widget.set_board(list(enumerate(solution)))
+            self.set_animal_emotion('happy', 'I remembered how to solve this one!')
+            self.status.showMessage(f'Found a {self.n}x{self.n} solution in {self.solver.nodes_visited:,} steps '
+                                    f'using what I learned in training.')
+            self.show_congratulations()
+            return
+        solution = self.solver.find_one()
+        if solution is None:
+            self.set_animal_emotion('sad', 'No solutions from here!')
+            self.status.showMessage('No solution exists for this board.')
+            return
+        self.board_widget.set_board(list(enumerate(solution)))
+        self.set_animal_emotion('happy', 'Here is a solution, built in a flash!')
+        self.status.showMessage(f'Built a {self.n}x{self.n} solution without searching.')
+        self.show_congratulations()
+
+    def learned_solution(self):
+        # First solution of a search that tries the Q-table's favourite columns first, or None when
+        # this size has no trained table or the search runs past LEARNED_SOLVE_BUDGET
+        if not os.path.exists(self.ai.store.path()):
+            return None
+        try:
+            return self.solver.search_first(self.ai.column_ordering(),
+                                            time.perf_counter() + LEARNED_SOLVE_BUDGET)
+        except SearchTimeout:
+            return None
+
+    def solve_enumerated(self, n, store):
+        try:
+            self.solution_cache.save(store)
+        except OSError as e:
+            print(f'Could not cache solutions: {e}')
+        if n != self.n or self.pager is None:
+            return  # The board changed while solving
+        if self.page_worker is not None:
+            self.page_worker.cancel()  # The stored set has every page already
+        # Same order as the lazy pages, so the browser keeps its place
+        self.pager = SolutionPager(store, SOLUTION_PAGE_SIZE)
+        total = self.solution_total = len(store)
+        if self.solutions:
+            self.load_solution_page(self.page_index)
+            self.show_solution(self.current_solution_idx, announce=False)
+        self.set_animal_emotion('excited', f'I found {total:,} solutions!')
+        self.status.showMessage(f'Found {total:,} solutions! ({store.nbytes:,} bytes in memory)')
+
+    def load_solution_page(self, page_index):
+        # Only for stored solution sets, whose pages are slices; lazy pages go through turn_page()
+        if self.pager is None:
+            return False
+        return self.set_solution_page(page_index, self.pager.page(page_index))
+
+    def set_solution_page(self, page_index, solutions):
+        if not solutions:
+            return False
+        self.page_index = page_index
+        self.solutions = [list(enumerate(cols)) for cols in solutions]
+        offset = page_index * self.pager.page_size
+        self.solution_selector.blockSignals(True)
+        self.solution_selector.clear()
+        if page_index > 0:
+            self.solution_selector.addItem('◂ Previous page', 'prev')
+        for i in range(len(self.solutions)):
+            self.solution_selector.addItem(f"Solution {offset + i + 1}", i)
+        if self.pager.has_page(page_index + 1):
+            self.solution_selector.addItem('Next page ▸', 'next')
+        self.solution_selector.blockSignals(False)
+        return True
+
+    def has_more_solutions(self):
+        return len(self.solutions) > 1 or (self.pager is not None and self.pager.has_page(1))
+
+    def show_solution(self, idx, announce=True):
+        self.current_solution_idx = idx
+        self.board_widget.set_board(self.solutions[idx])
+        self.solution_selector.blockSignals(True)
+        self.solution_selector.setCurrentIndex(self.solution_selector.findData(idx))
+        self.solution_selector.blockSignals(False)
+        if announce:
+            number = self.page_index * self.pager.page_size + idx + 1
+            total = f'{self.solution_total:,}' if self.solution_total is not None else 'many'
+            self.set_animal_emotion('excited', f'Showing solution {number:,} of {total}')
+
+    def count_solutions(self):
+        if self.n > MAX_SEARCH_N:
+            self.set_animal_emotion('confused', 'That board has far too many solutions to count!')
+            self.status.showMessage(f'Counting is available up to {MAX_SEARCH_N}x{MAX_SEARCH_N}.')
+            return
+        if self.start_count_job(self.show_count):
+            self.set_animal_emotion('thinking', 'Counting... Please wait!')
+
+    def show_count(self, n, total, subtotals):
+        if n != self.n:
+            return
+        self.set_animal_emotion('excited', f'There are {total:,} solutions on a {n}x{n} board!', duration=4000)
+        per_column = ', '.join(f'{col+1}: {count:,}' for col, count in enumerate(subtotals))
+        self.status.showMessage(f'{total:,} solutions. By first-row column: {per_column}')
+
+    def start_count_job(self, on_finished):
+        # Counts in the worker pool from a background thread, then calls on_finished(n, total, subtotals)
+        if self.solver_worker is not None:
+            self.status.showMessage('Still solving, please wait or cancel first.')
+            return False
+        n = self.n
+        subtotals = [0] * n
+        tasks = self.symmetry_chunks()
+
+        def add_subtotal(args, counts):
+            add_subtotals(subtotals, counts)
+            self.status.showMessage(f'Counting {n}x{n} solutions (multi-core)... {sum(subtotals):,} so far')
+
+        worker = SolveWorker(self.solver_service, count_tasks, tasks, self)
+        worker.partial_result.connect(add_subtotal)
+        worker.finished_result.connect(lambda results: on_finished(n, sum(subtotals), subtotals))
+        self.status.showMessage(f'Counting {n}x{n} solutions (multi-core)...')
+        self.run_solver_worker(worker)
+        return True
+
+    def start_enumerate_job(self, on_finished):
+        # Collects every solution into a SolutionStore in the background, then calls on_finished(n, store)
+        if self.solver_worker is not None:
+            return False
+        n = self.n
+        store = SolutionStore(n)
+
+        def add_solutions(args, buffer):
+            store.extend_buffer(buffer)
+            self.status.showMessage(f'Solving {n}x{n} (multi-core)... {len(store):,} solutions so far')
+
+        def finish(results):
+            store.sort()
+            on_finished(n, store)
+
+        worker = SolveWorker(self.solver_service, enumerate_tasks, self.symmetry_chunks(), self)
+        worker.partial_result.connect(add_solutions)
+        worker.finished_result.connect(finish)
+        self.status.showMessage(f'Solving {n}x{n} (multi-core)...')
+        self.run_solver_worker(worker)
+        return True
+
+    def symmetry_chunks(self):
+        return symmetry_chunks(self.n, self.solver_service.max_workers)
+
+    def run_solver_worker(self, worker):
+        self.solver_worker = worker
+        worker.progress.connect(self.show_solve_progress)
+        worker.cancelled.connect(self.solve_cancelled)
+        worker.failed.connect(self.solve_failed)
+        worker.finished.connect(self.solver_worker_done)
+        self.count_button.setDisabled(True)
+        self.cancel_button.setVisible(True)
+        self.progress_bar.setVisible(True)
+        worker.start()
+
+    def show_solve_progress(self, done, total):
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+
+    def cancel_solve(self):
+        if self.page_worker is not None:
+            self.page_worker.cancel()
+        if self.solver_worker is not None:
+            self.solver_worker.cancel()
+            self.status.showMessage('Cancelling...')
+
+    def solve_cancelled(self):
+        self.set_animal_emotion('neutral', 'Okay, I stopped solving.')
+        self.status.showMessage('Solve cancelled.')
+
+    def solve_failed(self, error):
+        self.set_animal_emotion('sad', 'Something went wrong while solving!')
+        self.status.showMessage(f'Solver error: {error}')
+
+    def solver_worker_done(self):
+        report = self.solver_worker.report
+        if report.finished:  # The per-worker detail goes to the status bar's tooltip
+            self.status.showMessage(f'{self.status.currentMessage()} ({report.summary()})')
+            self.status.setToolTip(report.format())
+        self.solver_worker.deleteLater()
+        self.solver_worker = None
+        self.cancel_button.setVisible(False)
+        self.progress_bar.setVisible(False)
+        self.count_button.setDisabled(False)
+
+    def select_solution(self, idx):
+        target = self.solution_selector.itemData(idx)
+        if target == 'prev':
+            self.turn_page(self.page_index - 1, show=-1)
+        elif target == 'next':
+            self.turn_page(self.page_index + 1, show=0)
+        elif target is not None and 0 <= target < len(self.solutions):
+            self.show_solution(target)
+
+    def turn_page(self, page_index, show=0):
+        # Shows solution number `show` of a page (-1: its last one; None: fills in the current page
+        # without changing the board). Stored pages are sliced at once; lazy ones are generated on a
+        # PageWorker, with the progress bar busy and Cancel available until page_loaded() runs.
+        if self.pager is None or page_index < 0:
+            return
+        if not self.pager.lazy:
+            self.page_loaded(self.pager, page_index, self.pager.page(page_index), show)
+            return
+        if self.page_worker is not None:
+            if self.page_worker.pager is self.pager:
+                self.status.showMessage('Still finding solutions, one moment...')
+                return
+            self.page_worker.cancel()  # Left over from an earlier solve
+            self.page_worker = None
+        worker = self.page_worker = PageWorker(self.pager, page_index, show, self)
+        worker.page_ready.connect(self.page_loaded)
+        worker.finished.connect(lambda: self.page_worker_done(worker))
+        worker.finished.connect(worker.deleteLater)
+        if self.solver_worker is None:  # Otherwise the bar and Cancel already belong to the pool job
+            self.progress_bar.setRange(0, 0)
+            self.progress_bar.setVisible(True)
+            self.cancel_button.setVisible(True)
+        worker.start()
+
+    def page_loaded(self, pager, page_index, solutions, show):
+        self.page_worker_done(self.sender())  # Free for the next page before its finished signal arrives
+        if pager is not self.pager:
+            return  # The board changed, or the full solution set replaced the lazy pages
+        if self.solution_total is None:
+            self.solution_total = pager.total
+        if not solutions:
+            if page_index > 0:
+                self.turn_page(0)  # Past the last page: wrap around to the first one
+            return
+        self.set_solution_page(page_index, solutions)
+        if show is None:
+            self.solution_selector.blockSignals(True)
+            self.solution_selector.setCurrentIndex(self.solution_selector.findData(self.current_solution_idx))
+            self.solution_selector.blockSignals(False)
+        else:
+            self.show_solution(show % len(self.solutions))
+        self.next_solution_btn.setVisible(self.has_more_solutions())
+
+    def page_worker_done(self, worker):
+        if worker is None or worker is not self.page_worker:
+            return
+        self.page_worker = None
+        if self.solver_worker is None:
+            self.cancel_button.setVisible(False)
+            self.progress_bar.setVisible(False)
+
+    def reset_board(self):
+        self.is_solved = False
+        self.board_widget.reset_board()
+        self.set_animal_emotion('neutral', 'Board reset!')
+        self.next_solution_btn.setVisible(False)
+        self.status.showMessage('Board has been reset. Ready to play!')
+        self.hint_button.setDisabled(False)
+        self.solve_button.setDisabled(False)
+
+    def change_animal(self, animal):
+        self.animal_type = animal
+        self.sounds.use(animal)
+        self.set_animal_emotion('neutral', f'You selected {animal}!')
+        self.board_widget.set_animal_type(animal)
+        self.update_animal_buttons()
+
+    def change_board_size(self, size):
+        self.cancel_solve()
+        self.n = int(size)
+        self.solver = NQueensSolver(self.n)
+        self.hint_engine = self.new_hint_engine()
+        self._ai = None  # Each size has its own table
+        self.board_layout.removeWidget(self.board_widget)
+        self.board_widget.deleteLater()
+        self.board_widget = BoardWidget(self.n, self.animal_type)
+        self.board_layout.insertWidget(0, self.board_widget)
+        self.last_repaint_count = 0
+        self.board_layout.addWidget(self.next_solution_btn)
+        self.board_widget.installEventFilter(self)
+        self.board_widget.place_message.connect(self.show_place_message)
+        self.board_widget.solved_signal.connect(self.show_congratulations)
+        self.board_widget.board_changed.connect(self.update_completion_status)
+        self.update_completion_status()
+        self.solutions = []
+        self.pager = None
+        self.solution_total = None
+        self.solution_selector.clear()
+        self.set_animal_emotion('neutral', f'Changed to {self.n}x{self.n} board!')
+        self.next_solution_btn.setVisible(False)
+        self.status.showMessage(f'Board size changed to {self.n}x{self.n}. Ready to play!')
+        self.is_solved = False
+        self.hint_button.setDisabled(False)
+        self.solve_button.setDisabled(False)
+        self.count_button.setDisabled(self.solver_worker is not None)
+
+    def closeEvent(self, event):
+        if self.page_worker is not None:
+            self.page_worker.cancel()
+            self.page_worker.wait(2000)
+        if self.solver_worker is not None:
+            self.solver_worker.cancel()
+            self.solver_worker.wait(2000)
+        self.solver_service.shutdown()
+        super().closeEvent(event)
+
+    def idle_animation(self):
+        emotion, message = random.choice(IDLE_ANIMATIONS)
+        self.set_animal_emotion(emotion, message, duration=2500)
+
+    def eventFilter(self, obj, event):
+        # Reset idle timer on any user interaction
+        if event.type() in (2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12):  # Mouse/keyboard events
+            self.idle_timer.start()
+        return super().eventFilter(obj, event)
+
+    def update_repaint_rate(self):
+        # Board repaints over the last second
+        count = self.board_widget.repaint_count
+        self.repaint_label.setText(f'{max(0, count - self.last_repaint_count)} repaints/s')
+        self.last_repaint_count = count
+
+    def toggle_metrics(self, enabled):
+        # Recording starts from scratch each time the overlay is switched on
+        if enabled:
+            METRICS.reset()
+        METRICS.enabled = enabled
+        self.metrics_label.setVisible(enabled)
+        self.export_metrics_button.setVisible(enabled)
+        self.update_metrics_overlay()
+
+    def update_metrics_overlay(self):
+        if METRICS.enabled:
+            self.metrics_label.setText(METRICS.format())
+
+    def export_metrics(self):
+        path = METRICS.export(time.strftime('metrics-%Y%m%d-%H%M%S.json'))
+        self.status.showMessage(f'Metrics written to {path}')
+
+    def update_completion_status(self):
+        # Boards up to MAX_INDEX_N answer from the completion index in well under a millisecond,
+        # once its background build is done (refresh_completion_status() runs then)
+        ways = self.hint_engine.completions(self.board_widget.queens)
+        if ways is None:
+            self.completion_label.setText('')
+        elif ways:
+            self.completion_label.setText(f"Completable: {ways} way{'s' if ways != 1 else ''} to finish")
+        else:
+            self.completion_label.setText('Not completable from here')
+
+    def show_place_message(self, valid, reason):
+        if self.is_solved:
+            self.status.showMessage('Board is already solved!')
+            return
+        if valid:
+            self.set_animal_emotion('happy', 'Good move!')
+            self.status.showMessage('Valid move! Keep going!')
+        else:
+            msg = 'Wrong place!'
+            if reason:
+                msg += f' Reason: {reason}'
+            self.set_animal_emotion('confused', msg, duration=2500)
+            self.status.showMessage(msg)
+
+    def pick_board_colors(self):
+        color1 = QColorDialog.getColor(self.board_widget.bg_color1, self, 'Pick Light Square Color')
+        if color1.isValid():
+            color2 = QColorDialog.getColor(self.board_widget.bg_color2, self, 'Pick Dark Square Color')
+            if color2.isValid():
+                self.board_widget.set_bg_colors(color1, color2)
+
+    def update_animal_buttons(self):
+        for animal, btn in self.animal_buttons.items():
+            if animal == self.animal_type:
+                btn.setChecked(True)
+                btn.setStyleSheet(f"font-size: 28px; background: {DARK_GREEN}; color: #fff; border-radius: 10px; padding: 6px;")
+            else:
+                btn.setChecked(False)
+                btn.setStyleSheet(f"font-size: 28px; background: {DARK_PANEL}; color: {DARK_TEXT}; border-radius: 10px; padding: 6px;")
+
+    def show_congratulations(self):
+        self.is_solved = True
+        self.hint_button.setDisabled(True)
+        self.solve_button.setDisabled(True)
+        self.board_widget.set_hint_highlights([])
+        msg = QMessageBox(self)
+        msg.setWindowTitle('Congratulations!')
+        msg.setText('🎉 Congratulations, well done! You solved the N-Queens puzzle! 🎉')
+        msg.setStyleSheet('QLabel{color: #27ae60; font-size: 20px;} QMessageBox{background-color: #232; border: 2px solid #27ae60;}')
+        msg.setIcon(QMessageBox.Information)
+        msg.exec_()
+        self.next_solution_btn.setVisible(self.has_more_solutions())
+
+    def show_next_solution(self):
+        if not self.solutions:
+            return
+        if self.current_solution_idx + 1 < len(self.solutions):
+            self.show_solution(self.current_solution_idx + 1)
+        else:
+            # Past the last solution, page_loaded() wraps around to the first page
+            self.turn_page(self.page_index + 1)
+
+def main(launched=None):
+    # launched: time.perf_counter() when the launcher started, so the report includes the imports
+    startup = StartupReport(launched if launched is not None else time.perf_counter())
+    startup.mark('imports')
+    try:
+        app = QApplication(sys.argv)
+        startup.mark('QApplication')
+        window = MainWindow()
+        startup.mark('window')
+
+        def first_paint():
+            startup.mark('first paint')
+            print(startup.format())
+
+        window.board_widget.first_painted.connect(first_paint)
+        app.aboutToQuit.connect(window.solver_service.shutdown)
+        window.show()
+        sys.exit(app.exec_())
+    except Exception as e:
+        print(f'Error: {e}')
+
+# No __main__ block on purpose: start the game with main.py. Pool workers re-import the launching
+# script, and launching from this module would load PyQt5 into every one of them.
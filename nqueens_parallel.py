@@ -0,0 +1,83 @@
+try:
+    from .nqueens_ai import NQueensSolver, SearchCancelled
+    from .solution_store import SolutionStore, pack_solutions
+    from .solver_service import cancelled, guided_chunks, split_work
+except (ImportError, SystemError):
+    from nqueens_ai import NQueensSolver, SearchCancelled
+    from solution_store import SolutionStore, pack_solutions
+    from solver_service import cancelled, guided_chunks, split_work
+
+# Multi-core solving on a SolverService, shared by the GUI, the command line and the benchmarks.
+# The task functions are what pool workers import and run, so this module must never import Qt.
+
+
+def count_tasks(args):
+    # Solutions per first-row column under a chunk of symmetry tasks, without building any of them;
+    # None once the job is cancelled
+    n, tasks = args
+    solver = NQueensSolver(n)
+    solver.cancel_check = cancelled
+    try:
+        return solver.count_by_first_column(tasks)
+    except SearchCancelled:
+        return None
+
+
+def enumerate_tasks(args):
+    # Every solution under a chunk of symmetry tasks (each fundamental board with its rotations
+    # and reflections), packed into one buffer; None once the job is cancelled
+    n, tasks = args
+    solver = NQueensSolver(n)
+    solver.cancel_check = cancelled
+    solutions = []
+    try:
+        for solution, _ in solver.iter_fundamental(tasks):
+            solutions.extend(solver.expand_symmetries(solution))
+    except SearchCancelled:
+        return None
+    return pack_solutions(solutions)
+
+
+def symmetry_chunks(n, workers):
+    # Many small pieces of the symmetry-reduced search, handed out in shrinking chunks as workers free up
+    chunks = guided_chunks(split_work(NQueensSolver(n), workers), workers)
+    return [(n, chunk) for chunk in chunks]
+
+
+def add_subtotals(subtotals, counts):
+    # Adds one count_tasks() result to the per-column totals
+    for col, count in enumerate(counts):
+        subtotals[col] += count
+
+
+def count_parallel(service, n):
+    # (total, solutions per first-row column) counted on the service's workers as a job of its own;
+    # None if the job is cancelled (service.cancel() from another thread)
+    from concurrent.futures import CancelledError
+    service.begin_job()
+    subtotals = [0] * n
+    try:
+        for _, counts in service.map_unordered(count_tasks, symmetry_chunks(n, service.max_workers)):
+            if counts is None:
+                return None
+            add_subtotals(subtotals, counts)
+    except CancelledError:
+        return None
+    return sum(subtotals), subtotals
+
+
+def enumerate_parallel(service, n):
+    # Every solution, enumerated on the service's workers as a job of its own, as a sorted SolutionStore;
+    # None if the job is cancelled
+    from concurrent.futures import CancelledError
+    service.begin_job()
+    store = SolutionStore(n)
+    try:
+        for _, buffer in service.map_unordered(enumerate_tasks, symmetry_chunks(n, service.max_workers)):
+            if buffer is None:
+                return None
+            store.extend_buffer(buffer)
+    except CancelledError:
+        return None
+    store.sort()
+    return store
@@ -0,0 +1,91 @@
+import os
+import struct
+import threading
+import warnings
+
+# File header: magic, board size; (state key, action, value) records follow
+QLOG_HEADER = struct.Struct('<6sH')
+QLOG_MAGIC = b'NQQLG2'
+
+
+class QTableStore:
+    # The Q-table of one board size as an append-only log of (state key, action, value) records.
+    # Replaying the log in order (later records win) rebuilds the table. flush() appends only the
+    # entries changed since the last flush; checkpoint() rewrites the log with one record per entry.
+    # Either can run on a background thread; writes never overlap and readers never see a torn file.
+    def __init__(self, n, directory='ai_memory', variant=''):
+        self.n = n
+        self.directory = directory
+        self.variant = variant  # Tables keyed differently (e.g. by symmetry class) get their own file
+        # n * n square bits plus a byte for the next-line code of canonical keys
+        self.key_width = (n * n + 7) // 8 + 1
+        self.record = struct.Struct(f'<{self.key_width}sBd')
+        self._writer = None
+
+    def path(self):
+        return os.path.join(self.directory, f'n{self.n:02d}{self.variant}.qlog')
+
+    def read(self):
+        # (keys, actions, values) of the latest record per entry; empty if there is no usable log
+        try:
+            with open(self.path(), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return [], [], []
+        if len(data) < QLOG_HEADER.size or QLOG_HEADER.unpack_from(data) != (QLOG_MAGIC, self.n):
+            warnings.warn(f'Ignoring unreadable Q-table log {self.path()}', RuntimeWarning, stacklevel=2)
+            return [], [], []
+        body = memoryview(data)[QLOG_HEADER.size:]
+        # A crash mid-append can leave a partial record at the end; drop it
+        body = body[:len(body) - len(body) % self.record.size]
+        latest = {}
+        for key, action, value in self.record.iter_unpack(body):
+            latest[(key, action)] = value
+        keys = [int.from_bytes(key, 'little') for key, _ in latest]
+        actions = [action for _, action in latest]
+        return keys, actions, list(latest.values())
+
+    def flush(self, table, background=False):
+        dirty, table.dirty = table.dirty, set()
+        if dirty:
+            self._run(self._append, (table, dirty), background)
+
+    def checkpoint(self, table, background=False):
+        table.dirty = set()
+        self._run(self._rewrite, (table,), background)
+
+    def wait(self):
+        # Blocks until a background write has finished
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+    def _run(self, write, args, background):
+        self.wait()
+        if background:
+            self._writer = threading.Thread(target=write, args=args, name='q-table-writer')
+            self._writer.start()
+        else:
+            write(*args)
+
+    def _pack(self, entries):
+        pack = self.record.pack
+        width = self.key_width
+        return b''.join(pack(key.to_bytes(width, 'little'), action, value) for key, action, value in entries)
+
+    def _append(self, table, dirty):
+        os.makedirs(self.directory, exist_ok=True)
+        data = self._pack((key, action, table.value(key, action)) for key, action in dirty)
+        with open(self.path(), 'ab') as f:
+            if f.tell() == 0:
+                f.write(QLOG_HEADER.pack(QLOG_MAGIC, self.n))
+            f.write(data)
+
+    def _rewrite(self, table):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path()
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(QLOG_HEADER.pack(QLOG_MAGIC, self.n))
+            f.write(self._pack(table.items()))
+        os.replace(tmp_path, path)
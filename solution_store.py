@@ -0,0 +1,136 @@
+import mmap
+import os
+import struct
+from array import array
+
+# File header: magic, board size, number of solutions; the packed solutions follow
+CACHE_HEADER = struct.Struct('<6sHQ')
+CACHE_MAGIC = b'NQSOL1'
+
+
+def pack_solutions(solutions):
+    # Raw one-byte-per-row buffer for a batch of solutions, as returned by pool workers
+    data = array('B')
+    for solution in solutions:
+        data.extend(solution)
+    return data.tobytes()
+
+
+class SolutionStore:
+    # Solutions of one board size packed as one byte per row in a single contiguous buffer,
+    # so a solution costs n bytes instead of a list of Python ints or (row, col) tuples.
+    def __init__(self, n, buffer=b''):
+        if not 0 < n <= 255:
+            raise ValueError(f'SolutionStore needs 1 <= n <= 255, got {n}')
+        self.n = n
+        self._data = array('B')
+        self._mmap = None
+        self.extend_buffer(buffer)
+
+    @classmethod
+    def from_mmap(cls, n, mapped, offset=0):
+        # Read-only store over a memory-mapped file; solutions are paged in by the OS as they are read
+        store = cls(n)
+        store._mmap = mapped
+        store._data = memoryview(mapped)[offset:]
+        return store
+
+    @property
+    def readonly(self):
+        return self._mmap is not None
+
+    def close(self):
+        if self._mmap is not None:
+            self._data.release()
+            self._mmap.close()
+            self._data = array('B')
+            self._mmap = None
+
+    def __len__(self):
+        return len(self._data) // self.n
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('solution index out of range')
+        start = index * self.n
+        return self._data[start:start + self.n].tolist()
+
+    def __iter__(self):
+        n = self.n
+        data = self._data
+        for start in range(0, len(data), n):
+            yield data[start:start + n].tolist()
+
+    def append(self, solution):
+        self._check_writable()
+        if len(solution) != self.n:
+            raise ValueError(f'expected a solution with {self.n} rows, got {len(solution)}')
+        self._data.extend(solution)
+
+    def extend_buffer(self, buffer):
+        self._check_writable()
+        if len(buffer) % self.n:
+            raise ValueError(f'buffer length {len(buffer)} is not a multiple of n={self.n}')
+        self._data.frombytes(bytes(buffer))
+
+    def sort(self):
+        self._check_writable()
+        # One byte per column, so byte order is the same as the order solve() lists solutions in
+        raw = self._data.tobytes()
+        n = self.n
+        records = sorted(raw[start:start + n] for start in range(0, len(raw), n))
+        self._data = array('B', b''.join(records))
+
+    def tobytes(self):
+        return self._data.tobytes()
+
+    @property
+    def nbytes(self):
+        return len(self._data)
+
+    def _check_writable(self):
+        if self.readonly:
+            raise ValueError('cannot modify a memory-mapped SolutionStore')
+
+
+class SolutionCache:
+    # Complete solution sets on disk, one file per board size. Files are written once and
+    # memory-mapped when loaded, so a cached board comes back instantly without reading it all into RAM.
+    def __init__(self, directory='solution_cache'):
+        self.directory = directory
+
+    def path(self, n):
+        return os.path.join(self.directory, f'n{n:02d}.sol')
+
+    def save(self, store):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(store.n)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(CACHE_HEADER.pack(CACHE_MAGIC, store.n, len(store)))
+            f.write(store.tobytes())
+        # Readers never see a half-written file
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, n):
+        # Memory-mapped store for board size n, or None if it is not cached (or the file is damaged)
+        try:
+            with open(self.path(n), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, size, count = CACHE_HEADER.unpack_from(mapped)
+        except struct.error:
+            mapped.close()
+            return None
+        if magic != CACHE_MAGIC or size != n or len(mapped) != CACHE_HEADER.size + count * n:
+            mapped.close()
+            return None
+        return SolutionStore.from_mmap(n, mapped, CACHE_HEADER.size)
+
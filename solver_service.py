@@ -0,0 +1,214 @@
+import os
+import time
+
+try:
+    from .metrics import METRICS
+except (ImportError, SystemError):
+    from metrics import METRICS
+
+# multiprocessing and concurrent.futures are imported when the pool first starts: the GUI creates
+# a SolverService at startup but may never solve anything, and the two take longer to import
+# than the solvers themselves
+
+# Prefixes per worker a split aims for, so a worker that finishes early always finds more work
+TASKS_PER_WORKER = 32
+
+# Modules a forkserver imports once, so every worker it forks starts with the solvers loaded
+WORKER_PRELOAD = ['nqueens_ai', 'nqueens_parallel', 'solution_store']
+
+# Set in every worker process: the id of the last cancelled job, shared with SolverService.cancel(),
+# and the job of the task the worker is running. Tasks of a cancelled job keep seeing the cancel
+# while later jobs run, so a straggler from an old job bails out instead of finishing its chunk.
+_cancelled_job = None
+_current_job = 0
+
+
+def _init_worker(cancelled_job):
+    global _cancelled_job
+    _cancelled_job = cancelled_job
+
+
+def cancelled():
+    # True inside a worker once the job of the running task has been cancelled
+    return _cancelled_job is not None and _cancelled_job.value >= _current_job
+
+
+def _run_task(job, fn, args):
+    # Runs in a worker: the task result plus which worker ran it and for how long
+    global _current_job
+    _current_job = job
+    started = time.perf_counter()
+    result = fn(args)
+    return os.getpid(), time.perf_counter() - started, result
+
+
+def split_work(solver, workers):
+    # Runs the symmetry-reduced search a few rows deep until there are enough subproblems to keep
+    # every worker busy; each one is a partial board that a worker resumes
+    depth = 0
+    tasks = solver.split_symmetry_tasks(depth)
+    while len(tasks) < workers * TASKS_PER_WORKER and depth < solver.n:
+        depth += 1
+        tasks = solver.split_symmetry_tasks(depth)
+    return tasks
+
+
+def guided_chunks(items, workers):
+    # Guided self-scheduling: each chunk takes a share of what is still left, so chunks start
+    # large (little overhead) and shrink toward the end (idle workers pick up the stragglers)
+    chunks = []
+    start = 0
+    while start < len(items):
+        size = max(1, (len(items) - start) // (2 * workers))
+        chunks.append(items[start:start + size])
+        start += size
+    return chunks
+
+
+class UtilizationReport:
+    # Busy time per worker process over one job, against the job's wall-clock time. The clock starts
+    # at begin(), which map_unordered() calls once its first task is submitted, so pool startup
+    # and any wait before the job runs are not counted.
+    def __init__(self, workers):
+        self.workers = workers
+        self.started = time.perf_counter()
+        self.wall = 0.0
+        self.busy = {}
+        self.tasks = {}
+        self.finished = False  # Set once every task of the job is done
+
+    def begin(self):
+        self.started = time.perf_counter()
+
+    def record(self, pid, seconds):
+        METRICS.observe('solve.task', seconds)
+        self.busy[pid] = self.busy.get(pid, 0.0) + seconds
+        self.tasks[pid] = self.tasks.get(pid, 0) + 1
+        self.wall = time.perf_counter() - self.started
+
+    def finish(self):
+        self.wall = time.perf_counter() - self.started
+        self.finished = True
+        METRICS.observe('solve.job', self.wall)
+
+    @property
+    def utilization(self):
+        # Share of the pool's available time spent running tasks
+        if not self.wall:
+            return 0.0
+        return sum(self.busy.values()) / (self.wall * self.workers)
+
+    def summary(self):
+        return (f'{sum(self.tasks.values())} tasks in {self.wall:.2f}s on {self.workers} workers, '
+                f'{self.utilization:.0%} utilization')
+
+    def format(self):
+        lines = [self.summary()]
+        for pid in sorted(self.busy):
+            share = self.busy[pid] / self.wall if self.wall else 0.0
+            lines.append(f'  worker {pid}: {self.tasks[pid]} tasks, {self.busy[pid]:.2f}s busy ({share:.0%})')
+        return '\n'.join(lines)
+
+
+def default_start_method():
+    # Workers start from a fresh interpreter instead of a fork of the caller, so they never inherit
+    # Qt or the caller's threads; a forkserver (POSIX) makes that almost as cheap as forking
+    import multiprocessing
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return 'forkserver'
+    return 'spawn'
+
+
+class SolverService:
+    # Long-lived process pool shared by every solve. Worker processes are started once,
+    # on first use, and reused across solves and board sizes until shutdown().
+    def __init__(self, max_workers=None, start_method=None):
+        self.max_workers = max_workers or os.cpu_count() or 2
+        self.start_method = start_method  # None: default_start_method(), decided when the pool starts
+        self._context = None
+        self._executor = None
+        self._job = 0  # Id of the current job; every task carries it, see begin_job()
+        self._cancelled_job = None
+        self._pending = set()
+
+    @property
+    def running(self):
+        return self._executor is not None
+
+    @property
+    def context(self):
+        if self._context is None:
+            import multiprocessing
+            self.start_method = self.start_method or default_start_method()
+            self._context = multiprocessing.get_context(self.start_method)
+            if self.start_method == 'forkserver':
+                self._context.set_forkserver_preload(WORKER_PRELOAD)
+        return self._context
+
+    @property
+    def cancelled_job(self):
+        # Shared with every worker; created with the pool, since even a shared Value can start a helper process
+        if self._cancelled_job is None:
+            self._cancelled_job = self.context.Value('q', -1)
+        return self._cancelled_job
+
+    def start(self):
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=self.context,
+                                                 initializer=_init_worker,
+                                                 initargs=(self.cancelled_job,))
+        return self._executor
+
+    def submit(self, fn, args):
+        # Future of (worker pid, seconds, fn(args)) for a task of the current job
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            future = self.start().submit(_run_task, self._job, fn, args)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed by the OS); replace the pool once and retry
+            self._executor = None
+            future = self.start().submit(_run_task, self._job, fn, args)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def map_unordered(self, fn, args_list, report=None):
+        # Yields (args, result) pairs as soon as each task finishes; worker timings go to report
+        from concurrent.futures import as_completed
+        futures = {}
+        for args in args_list:
+            futures[self.submit(fn, args)] = args
+            if report is not None and len(futures) == 1:
+                report.begin()
+        for future in as_completed(futures):
+            pid, seconds, result = future.result()
+            if report is not None:
+                report.record(pid, seconds)
+            yield futures[future], result
+        if report is not None:
+            report.finish()
+
+    def begin_job(self):
+        # Starts a new job: tasks submitted from now on are not affected by earlier cancels
+        self._job += 1
+        return self._job
+
+    def cancel(self):
+        # Drops queued tasks and tells running ones of the current job (and any older one) to stop
+        # at their next check
+        if self._cancelled_job is not None:
+            self._cancelled_job.value = self._job
+        for future in list(self._pending):
+            future.cancel()
+
+    def shutdown(self, wait=True):
+        if self._executor is None:
+            return
+        self.cancel()
+        executor, self._executor = self._executor, None
+        try:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        except TypeError:  # cancel_futures needs Python 3.9+
+            executor.shutdown(wait=wait)
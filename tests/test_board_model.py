@@ -0,0 +1,49 @@
+import pytest
+
+from board_model import BoardModel
+
+
+def test_counters_follow_place_and_remove():
+    model = BoardModel(5)
+    model.place(0, 0)
+    model.place(2, 2)
+    assert model.rows == [1, 0, 1, 0, 0]
+    assert model.cols == [1, 0, 1, 0, 0]
+    assert model.diags[0 - 0 + 4] == 2  # both on the main diagonal
+    assert model.antis[0] == 1 and model.antis[4] == 1
+    assert model.attacking_pairs == 1
+    model.remove(2, 2)
+    assert model.rows == [1, 0, 0, 0, 0]
+    assert model.diags[4] == 1
+    assert model.attacking_pairs == 0
+    assert model.queens == [(0, 0)]
+
+
+def test_attacks_and_validity():
+    model = BoardModel(4, [(0, 1)])
+    assert model.attacks(0, 1) == 0  # the queen itself is not counted
+    assert model.attacks(1, 0) == 1  # diagonal
+    assert model.attacks(3, 1) == 1  # column
+    assert model.attacks(2, 0) == 0
+    assert model.is_valid(2, 0) == (True, '')
+    assert model.is_valid(3, 1)[0] is False
+    assert model.is_valid(0, 3)[0] is False
+    assert model.is_valid(1, 2)[0] is False
+
+
+def test_is_solved():
+    model = BoardModel(4, [(0, 1), (1, 3), (2, 0)])
+    assert not model.is_solved()
+    model.place(3, 2)
+    assert model.is_solved()
+    model.remove(3, 2)
+    model.place(3, 3)
+    assert not model.is_solved()
+
+
+def test_rejects_bad_squares():
+    model = BoardModel(4, [(1, 1)])
+    with pytest.raises(ValueError):
+        model.place(4, 0)
+    with pytest.raises(ValueError):
+        model.place(1, 1)
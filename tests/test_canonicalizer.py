@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from ai_learning import Canonicalizer, QLearningAI
+from nqueens_ai import NQueensSolver
+from train_ai import play_episodes
+
+
+def mirror(state, n):
+    return [n - 1 - col for col in state]
+
+
+@pytest.mark.parametrize('n', [4, 5, 6, 8])
+def test_mirrored_states_share_a_key(n):
+    canon = Canonicalizer(n)
+    rng = random.Random(n)
+    for _ in range(200):
+        state = [rng.randrange(n) for _ in range(rng.randrange(n + 1))]
+        assert canon.canonical(mirror(state, n))[0] == canon.canonical(state)[0]
+
+
+def test_actions_map_back_for_mirrored_states(tmp_path):
+    n = 6
+    ai = QLearningAI(n, storage_dir=str(tmp_path), backend='dict')
+    state = [1, 3]
+    ai.update(state, 0, 1.0, None)
+    assert ai.best_action(state) == 0
+    assert ai.best_action(mirror(state, n)) == n - 1
+    assert ai.action_values(mirror(state, n)) == {n - 1: ai.action_values(state)[0]}
+
+
+class ScriptedPolicy:
+    # Plays the given columns, checking that every key play_episodes() asks about is
+    # Canonicalizer.canonical() of the columns played so far
+    def __init__(self, canon, columns):
+        self.canon = canon
+        self.columns = columns
+        self.placed = []
+
+    def get(self, key):
+        expected, flip = self.canon.canonical(self.placed)
+        assert key == expected
+        col = self.columns[len(self.placed)]
+        self.placed.append(col)
+        return self.canon.n - 1 - col if flip else col
+
+
+@pytest.mark.parametrize('n', [4, 5, 6, 7])
+def test_play_episodes_keys_match_canonical(n):
+    canon = Canonicalizer(n)
+    rng = random.Random(n)
+    scripts = NQueensSolver(n).solve() + [[rng.randrange(n) for _ in range(n)] for _ in range(50)]
+    for columns in scripts:
+        policy = ScriptedPolicy(canon, columns)
+        keys, actions, rewards, next_keys, _ = play_episodes((n, 1, 0.0, 0, policy, True))
+        for row, (key, action) in enumerate(zip(keys, actions)):
+            expected, flip = canon.canonical(columns[:row])
+            assert key == expected
+            assert action == (n - 1 - columns[row] if flip else columns[row])
+        assert next_keys[:-1] == keys[1:]
+        assert next_keys[-1] is None
@@ -0,0 +1,18 @@
+from hint_engine import HintEngine
+
+
+def test_index_is_built_in_the_background():
+    ready = []
+    engine = HintEngine(8, on_index_ready=ready.append)
+    assert engine.wait_for_index() is not None
+    assert ready == [8]
+    assert engine.completions([]) == 92
+    assert engine.completions([(0, 0)]) == 4
+
+
+def test_large_board_hint_keeps_the_queens():
+    engine = HintEngine(60)
+    queens = [(0, 5), (1, 9), (3, 1), (10, 20)]
+    hint = engine.suggest(queens)
+    assert hint.kind == 'place' and hint.guaranteed
+    assert engine.completions(queens) is None
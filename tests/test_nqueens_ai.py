@@ -0,0 +1,101 @@
+import pytest
+
+from nqueens_ai import NQueensSolver, SearchCancelled
+
+# Number of solutions for n = 0..10
+KNOWN_COUNTS = [1, 1, 0, 0, 2, 10, 4, 40, 92, 352, 724]
+
+
+@pytest.mark.parametrize('n', range(1, 9))
+def test_bitmask_matches_backtrack(n):
+    assert NQueensSolver(n, 'bitmask').solve() == NQueensSolver(n, 'backtrack').solve()
+
+
+@pytest.mark.parametrize('n', range(1, 11))
+def test_counts(n):
+    solver = NQueensSolver(n)
+    assert solver.count() == KNOWN_COUNTS[n]
+    assert len(solver.solve()) == KNOWN_COUNTS[n]
+
+
+@pytest.mark.parametrize('n', range(1, 10))
+def test_symmetric_enumeration_matches_solve(n):
+    assert NQueensSolver(n).solve_symmetric() == NQueensSolver(n).solve()
+
+
+@pytest.mark.parametrize('engine', ['bitmask', 'backtrack'])
+def test_prefix_search(engine):
+    solver = NQueensSolver(8, engine)
+    solutions = solver.solve()
+    for prefix in ([0], [1, 3], [3, 1, 4]):
+        expected = [s for s in solutions if s[:len(prefix)] == prefix]
+        assert solver.solve_from(prefix) == expected
+        assert solver.count_from(prefix) == len(expected)
+    assert solver.solve_from([0, 1]) == []
+
+
+@pytest.mark.parametrize('engine', ['bitmask', 'backtrack'])
+def test_cursor_resume(engine):
+    solver = NQueensSolver(7, engine)
+    solutions = solver.solve()
+    assert list(solver.iter_solutions()) == solutions
+    for index, cursor in enumerate(solutions):
+        assert list(solver.iter_solutions(cursor)) == solutions[index + 1:]
+
+
+def test_invalid_cursor_is_rejected():
+    solver = NQueensSolver(6)
+    with pytest.raises(ValueError):
+        list(solver.iter_solutions([0, 1, 2, 3, 4, 5]))
+    with pytest.raises(ValueError):
+        list(solver.iter_solutions([0, 1]))
+
+
+def test_count_by_first_column():
+    solver = NQueensSolver(8)
+    expected = [0] * 8
+    for solution in solver.solve():
+        expected[solution[0]] += 1
+    assert solver.count_by_first_column() == expected
+    for depth in range(4):
+        assert solver.count_by_first_column(solver.split_symmetry_tasks(depth)) == expected
+
+
+def test_cancel_check_stops_search():
+    solver = NQueensSolver(12)
+    calls = []
+    solver.cancel_check = lambda: calls.append(1) or len(calls) > 2
+    with pytest.raises(SearchCancelled):
+        solver.count_from([])
+    with pytest.raises(SearchCancelled):
+        list(solver.iter_solutions())
+
+
+def is_solution(solution):
+    n = len(solution)
+    return (sorted(solution) == list(range(n))
+            and len({row - col for row, col in enumerate(solution)}) == n
+            and len({row + col for row, col in enumerate(solution)}) == n)
+
+
+@pytest.mark.parametrize('n', [8, 30, 100])
+def test_repair_keeps_the_given_queens(n):
+    solver = NQueensSolver(n)
+    # The mirrored construction: a known solution that repair() cannot just return as constructed
+    target = [n - 1 - col for col in solver.find_one()]
+    queens = [(row, target[row]) for row in range(0, n, 5)]
+    solution = solver.repair(queens, seed=2)
+    assert is_solution(solution)
+    assert all(solution[row] == col for row, col in queens)
+
+
+@pytest.mark.parametrize('n', [1, 4, 5, 6, 7, 8, 9, 10])
+def test_min_conflicts_finds_a_solution_for_every_seed(n):
+    solver = NQueensSolver(n)
+    for seed in range(100):
+        assert is_solution(solver.find_one('min_conflicts', seed=seed))
+
+
+def test_repair_rejects_attacking_queens():
+    assert NQueensSolver(8).repair([(0, 0), (2, 2)]) is None
+    assert NQueensSolver(8).repair([(0, 3), (0, 5)]) is None
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from ai_learning import DictQTable
+from q_store import QLOG_HEADER, QTableStore
+
+
+def make_table(n, entries):
+    table = DictQTable(n)
+    table.load(*zip(*entries))
+    return table
+
+
+def test_flush_appends_only_changed_entries(tmp_path):
+    store = QTableStore(5, str(tmp_path))
+    table = make_table(5, [(3, 1, 0.5), (7, 2, -1.0)])
+    table.dirty = {(3, 1), (7, 2)}
+    store.flush(table)
+    size = os.path.getsize(store.path())
+    assert size == QLOG_HEADER.size + 2 * store.record.size
+    table.table[3][1] = 0.75
+    table.dirty = {(3, 1)}
+    store.flush(table)
+    assert os.path.getsize(store.path()) == size + store.record.size
+    assert not table.dirty
+
+
+def test_replay_keeps_latest_record(tmp_path):
+    store = QTableStore(5, str(tmp_path))
+    table = make_table(5, [(3, 1, 0.5), (1 << 24, 4, 2.0)])
+    table.dirty = {(3, 1), (1 << 24, 4)}
+    store.flush(table)
+    table.table[3][1] = -0.25
+    table.dirty = {(3, 1)}
+    store.flush(table, background=True)
+    store.wait()
+    keys, actions, values = store.read()
+    assert sorted(zip(keys, actions, values)) == [(3, 1, -0.25), (1 << 24, 4, 2.0)]
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    store = QTableStore(4, str(tmp_path))
+    table = make_table(4, [(9, 0, 1.5), (10, 3, 0.5)])
+    table.dirty = {(9, 0), (10, 3)}
+    store.flush(table)
+    with open(store.path(), 'r+b') as f:
+        f.truncate(os.path.getsize(store.path()) - 3)
+    keys, actions, values = store.read()
+    assert len(keys) == 1
+
+
+def test_unreadable_log_reads_empty(tmp_path):
+    store = QTableStore(4, str(tmp_path))
+    assert store.read() == ([], [], [])
+    with open(store.path(), 'wb') as f:
+        f.write(b'garbage')
+    with pytest.warns(RuntimeWarning):
+        assert store.read() == ([], [], [])
+
+
+def test_log_of_another_board_size_is_ignored(tmp_path):
+    store = QTableStore(4, str(tmp_path))
+    table = make_table(4, [(1, 1, 1.0)])
+    table.dirty = {(1, 1)}
+    store.flush(table)
+    other = QTableStore(5, str(tmp_path))
+    os.replace(store.path(), other.path())
+    with pytest.warns(RuntimeWarning):
+        assert other.read() == ([], [], [])
+
+
+def test_checkpoint_compacts_the_log(tmp_path):
+    store = QTableStore(5, str(tmp_path))
+    table = make_table(5, [(3, 1, 0.5), (7, 2, -1.0)])
+    for value in (0.1, 0.2, 0.3):
+        table.table[3][1] = value
+        table.dirty = {(3, 1), (7, 2)}
+        store.flush(table)
+    store.checkpoint(table)
+    assert os.path.getsize(store.path()) == QLOG_HEADER.size + 2 * store.record.size
+    assert sorted(zip(*store.read())) == [(3, 1, 0.3), (7, 2, -1.0)]
+    assert not os.path.exists(store.path() + '.tmp')
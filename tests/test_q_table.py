@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from ai_learning import ArrayQTable, DictQTable, QLearningAI
+
+pytest.importorskip('numpy')
+
+
+def random_batch(rng, n, states=6, size=40):
+    # Transitions over a few states, so pairs repeat and next states are often already known
+    keys = [rng.randrange(states) for _ in range(size)]
+    actions = [rng.randrange(n) for _ in range(size)]
+    rewards = [rng.choice([-1.0, 0.0, 1.0]) for _ in range(size)]
+    next_keys = [rng.choice([None, rng.randrange(states)]) for _ in range(size)]
+    return keys, actions, rewards, next_keys
+
+
+def entries(table):
+    return sorted((key, action, round(value, 9)) for key, action, value in table.items())
+
+
+def test_backends_agree_on_batches():
+    rng = random.Random(3)
+    dict_table, array_table = DictQTable(5), ArrayQTable(5, capacity=2)  # Small, so the array grows
+    for _ in range(20):
+        batch = random_batch(rng, 5)
+        dict_changes = dict_table.update_encoded(*batch, alpha=0.5, gamma=0.9)
+        array_changes = array_table.update_encoded(*batch, alpha=0.5, gamma=0.9)
+        assert len(dict_changes) == len(array_changes) == len(batch[0])
+        assert list(array_changes) == pytest.approx(dict_changes)
+        assert entries(dict_table) == entries(array_table)
+        assert dict_table.dirty == array_table.dirty
+    assert len(array_table) == len(dict_table)
+    keys = list(range(8))  # Two of them never seen
+    assert [array_table.best_action(key) for key in keys] == [dict_table.best_action(key) for key in keys]
+    assert array_table.policy() == {key: dict_table.best_action(key) for key in dict_table.table}
+
+
+def test_repeated_pair_moves_by_mean_error():
+    for table in (DictQTable(4), ArrayQTable(4)):
+        changes = table.update_encoded([1, 1], [2, 2], [1.0, 0.0], [None, None], alpha=0.5, gamma=0.9)
+        assert list(changes) == [0.25, 0.25]
+        assert table.value(1, 2) == 0.25
+
+
+def test_best_actions_skip_untried_actions():
+    table = ArrayQTable(4)
+    table.load([7, 7, 9], [1, 3, 0], [-0.5, -0.25, -2.0])
+    assert table.best_actions([7, 9, 8]).tolist() == [3, 0, -1]
+    assert table.action_values(7) == {1: -0.5, 3: -0.25}
+
+
+def test_update_batch_is_the_same_on_both_backends(tmp_path):
+    states = [[], [], [0], [0, 2]]
+    actions = [0, 0, 2, 4]
+    rewards = [0.0, 0.0, 0.0, -1.0]
+    next_states = [[0], [0], [0, 2], None]
+    results = []
+    for backend in ('dict', 'numpy'):
+        ai = QLearningAI(5, storage_dir=str(tmp_path / backend), backend=backend)
+        results.append((list(ai.update_batch(states, actions, rewards, next_states)),
+                        ai.action_values([0]), ai.best_action([])))
+    assert results[0] == results[1]
@@ -0,0 +1,56 @@
+import pytest
+
+from nqueens_ai import NQueensSolver
+from solution_store import SolutionCache, SolutionStore, pack_solutions
+
+
+def test_store_round_trip():
+    solutions = NQueensSolver(6).solve()
+    store = SolutionStore(6, pack_solutions(reversed(solutions)))
+    assert len(store) == len(solutions)
+    assert store.nbytes == 6 * len(solutions)
+    store.sort()
+    assert list(store) == solutions
+    assert store[0] == solutions[0]
+    assert store[-1] == solutions[-1]
+    assert store[1:3] == solutions[1:3]
+    with pytest.raises(IndexError):
+        store[len(solutions)]
+
+
+def test_store_rejects_bad_input():
+    store = SolutionStore(4)
+    with pytest.raises(ValueError):
+        store.append([0, 1])
+    with pytest.raises(ValueError):
+        store.extend_buffer(b'\x00\x01\x02')
+    with pytest.raises(ValueError):
+        SolutionStore(0)
+
+
+def test_cache_round_trip(tmp_path):
+    cache = SolutionCache(str(tmp_path))
+    assert cache.load(8) is None
+    solutions = NQueensSolver(8).solve()
+    cache.save(SolutionStore(8, pack_solutions(solutions)))
+    loaded = cache.load(8)
+    try:
+        assert loaded.readonly
+        assert list(loaded) == solutions
+        with pytest.raises(ValueError):
+            loaded.append(solutions[0])
+    finally:
+        loaded.close()
+    assert cache.load(7) is None
+
+
+def test_cache_ignores_damaged_files(tmp_path):
+    cache = SolutionCache(str(tmp_path))
+    cache.save(SolutionStore(5, pack_solutions(NQueensSolver(5).solve())))
+    path = cache.path(5)
+    with open(path, 'r+b') as f:
+        f.truncate(20)
+    assert cache.load(5) is None
+    with open(path, 'wb') as f:
+        f.write(b'not a cache file at all')
+    assert cache.load(5) is None
@@ -0,0 +1,43 @@
+import threading
+import time
+
+import pytest
+
+from nqueens_ai import NQueensSolver
+from nqueens_parallel import count_parallel, count_tasks, enumerate_parallel
+from solver_service import SolverService
+
+
+@pytest.fixture
+def service():
+    service = SolverService(max_workers=1)
+    yield service
+    service.shutdown()
+
+
+def test_cancel_stops_running_task_of_that_job_only(service):
+    service.submit(count_tasks, (4, [('small', 0)])).result()  # Start the worker first
+    service.begin_job()
+    slow = service.submit(count_tasks, (16, [('corner', 2)]))  # Takes many seconds unless cancelled
+    time.sleep(0.5)
+    service.cancel()
+    service.begin_job()
+    started = time.perf_counter()
+    quick = service.submit(count_tasks, (8, NQueensSolver(8).symmetry_tasks()))
+    assert slow.result()[2] is None
+    assert quick.result()[2] == [4, 8, 16, 18, 18, 16, 8, 4]
+    assert time.perf_counter() - started < 5
+
+
+def test_parallel_count_and_enumeration(service):
+    solutions = NQueensSolver(9).solve()
+    total, subtotals = count_parallel(service, 9)
+    assert total == len(solutions)
+    assert subtotals == NQueensSolver(9).count_by_first_column()
+    assert [list(solution) for solution in enumerate_parallel(service, 9)] == solutions
+
+
+def test_cancelled_parallel_count_returns_none(service):
+    threading.Timer(0.5, service.cancel).start()
+    assert count_parallel(service, 16) is None
+    assert count_parallel(service, 8) == (92, [4, 8, 16, 18, 18, 16, 8, 4])
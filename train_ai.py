@@ -0,0 +1,159 @@
+import argparse
+import random
+import time
+
+try:
+    from .ai_learning import Canonicalizer, QLearningAI
+    from .metrics import METRICS
+    from .solver_service import SolverService
+except (ImportError, SystemError):
+    from ai_learning import Canonicalizer, QLearningAI
+    from metrics import METRICS
+    from solver_service import SolverService
+
+
+def play_episodes(args):
+    # Runs in a worker: epsilon-greedy placement episodes, one queen per row from the top,
+    # following a snapshot of the greedy policy. An attacked square ends the episode with -1,
+    # a full board with +1. Transitions come back encoded the way QLearningAI keys its table:
+    # with symmetry, the 8 images of the position are kept up to date queen by queen and the
+    # smallest one (see Canonicalizer) is the key, with actions mirrored where it says so.
+    n, episodes, epsilon, seed, policy, symmetry = args
+    rng = random.Random(seed)
+    canon = Canonicalizer(n) if symmetry else None
+    keys, actions, rewards, next_keys = [], [], [], []
+    solved = 0
+    full = (1 << n) - 1
+    last = n - 1
+    for _ in range(episodes):
+        key = cols = left = right = 0
+        flip = False
+        images = [0] * 8
+        if canon is not None:
+            key, flip = min((canon.line_codes[t][0], canon.flips[t]) for t in canon.candidates[0])
+        for row in range(n):
+            action = policy.get(key) if rng.random() >= epsilon else None
+            if action is None:
+                action = rng.randrange(n)
+            elif flip:
+                action = last - action
+            bit = 1 << action
+            keys.append(key)
+            actions.append(last - action if flip else action)
+            if (cols | left | right) & bit:
+                rewards.append(-1.0)
+                next_keys.append(None)
+                break
+            if canon is None:
+                key |= 1 << (row * n + action)
+            else:
+                square = row * n + action
+                for t in canon.active:
+                    images[t] |= canon.square_bits[t][square]
+                if row < last:
+                    key, flip = min((images[t] | canon.line_codes[t][row + 1], canon.flips[t])
+                                    for t in canon.candidates[row + 1])
+            cols |= bit
+            left = ((left | bit) << 1) & full
+            right = (right | bit) >> 1
+            if row == n - 1:
+                rewards.append(1.0)
+                next_keys.append(None)
+                solved += 1
+            else:
+                rewards.append(0.0)
+                next_keys.append(key)
+    return keys, actions, rewards, next_keys, solved
+
+
+def greedy_rollout(ai):
+    # Queens placed by always taking the best known action, stopping at the first unknown
+    # state or attacked square; a full-length result means the greedy policy solves the board
+    placed = []
+    for _ in range(ai.n):
+        col = ai.best_action(placed)
+        if col is None or any(c == col or abs(c - col) == len(placed) - r for r, c in enumerate(placed)):
+            break
+        placed.append(col)
+    return placed
+
+
+def train(n, episodes, rounds=200, workers=None, epsilon=0.1, seed=0, patience=10, symmetry=True, service=None):
+    # Self-play in rounds: every worker plays its share of the round's episodes against the
+    # current policy, then the master applies all their transitions as one batched update.
+    # Stops early once the greedy policy has solved the board for `patience` rounds in a row.
+    ai = QLearningAI(n, backend='numpy', symmetry=symmetry)
+    own_service = service is None
+    if own_service:
+        service = SolverService(workers)
+    per_worker = max(1, episodes // (rounds * service.max_workers))
+    started = time.perf_counter()
+    played = 0
+    streak = 0
+    try:
+        for round_index in range(rounds):
+            round_started = time.perf_counter()
+            policy = ai.q_table.policy()
+            tasks = [(n, per_worker, epsilon, seed + round_index * service.max_workers + worker, policy, symmetry)
+                     for worker in range(service.max_workers)]
+            solved = 0
+            total_change = 0.0
+            updated = 0
+            for _, (keys, actions, rewards, next_keys, worker_solved) in service.map_unordered(play_episodes, tasks):
+                changes = ai.q_table.update_encoded(keys, actions, rewards, next_keys, ai.alpha, ai.gamma)
+                total_change += float(abs(changes).sum())
+                updated += len(changes)
+                solved += worker_solved
+            round_episodes = per_worker * service.max_workers
+            played += round_episodes
+            elapsed = time.perf_counter() - round_started
+            mean_change = total_change / max(1, updated)
+            greedy = greedy_rollout(ai)
+            print(f'n={n} round {round_index + 1}/{rounds}: {round_episodes / elapsed:,.0f} episodes/s, '
+                  f'{solved / round_episodes:.1%} solved, mean |dQ| {mean_change:.5f}, '
+                  f'{len(ai.q_table):,} states, greedy policy places {len(greedy)}/{n}')
+            streak = streak + 1 if len(greedy) == n else 0
+            if streak >= patience:
+                print(f'n={n} converged after {round_index + 1} rounds')
+                break
+    finally:
+        if own_service:
+            service.shutdown()
+    # Training touches most entries many times over, so write a compact log instead of appending
+    ai.checkpoint()
+    total = time.perf_counter() - started
+    print(f'n={n}: {played:,} episodes in {total:.1f}s ({played / total:,.0f}/s), saved to {ai.store.path()}')
+    return ai
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Train the Q-learning agent by parallel self-play, without the GUI.')
+    parser.add_argument('sizes', nargs='*', type=int, default=[8], help='board sizes to train (default: 8)')
+    parser.add_argument('--episodes', type=int, default=1000000, help='episode budget per board size')
+    parser.add_argument('--rounds', type=int, default=200, help='policy refreshes (batched updates) per board size')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--epsilon', type=float, default=0.1, help='exploration rate during self-play')
+    parser.add_argument('--patience', type=int, default=10,
+                        help='stop once the greedy policy has solved the board this many rounds in a row')
+    parser.add_argument('--no-symmetry', dest='symmetry', action='store_false',
+                        help='learn rotated and reflected positions separately')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='time the batched Q-updates and write the metrics to this JSON file')
+    args = parser.parse_args(argv)
+    if args.metrics:
+        METRICS.reset()
+        METRICS.enabled = True
+    service = SolverService(args.workers)
+    try:
+        for n in args.sizes:
+            train(n, args.episodes, rounds=args.rounds, epsilon=args.epsilon, seed=args.seed,
+                  patience=args.patience, symmetry=args.symmetry, service=service)
+    finally:
+        service.shutdown()
+        if args.metrics:
+            print(f'Metrics written to {METRICS.export(args.metrics)}')
+
+
+if __name__ == '__main__':
+    main()